@@ -1,923 +1,4409 @@
-# Linkedin-Creeps-Scrapper-V7
-
-import os
-import time
-import random
-import json
-import csv
-import logging
-from zipfile import ZipFile
-from urllib.parse import urljoin, urlparse
-import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import pdfkit
-from PIL import Image
-import io
-
-class LinkedInScraperPro:
-    def __init__(self, profile_url, email=None, password=None, headless=False, max_scrolls=15):
-        """
-        Initialize LinkedIn Creeps Scraper
-        
-        Parameters:
-            profile_url (str): LinkedIn profile URL
-            email (str, optional): Email for login
-            password (str, optional): Password for login
-            headless (bool): Run browser in headless mode
-            max_scrolls (int): Maximum scroll attempts to load content
-        """
-        self.profile_url = self._validate_url(profile_url)
-        self.email = email
-        self.password = password
-        self.headless = headless
-        self.max_scrolls = max_scrolls
-        self.data_dir = "linkedin_data"
-        self.driver = None
-        self.wait_time = random.uniform(2, 5)
-        self.max_retries = 3
-        self.logger = self._setup_logging()
-        
-        # Create data directory
-        os.makedirs(self.data_dir, exist_ok=True)
-
-    def _setup_logging(self):
-        """Configure logging"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(os.path.join(self.data_dir, 'scraper.log')),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
-
-    def _validate_url(self, url):
-        """Validate and normalize LinkedIn profile URL"""
-        if not url:
-            raise ValueError("Profile URL cannot be empty")
-        
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-            
-        parsed = urlparse(url)
-        if 'linkedin.com' not in parsed.netloc:
-            raise ValueError("URL must be a valid LinkedIn profile")
-            
-        return url.rstrip('/')
-
-    def start_driver(self):
-        """Initialize WebDriver with optimal configuration"""
-        try:
-            options = webdriver.ChromeOptions()
-            
-            # Basic configuration
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # Stability settings
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-plugins")
-            
-            # Natural user agent
-            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            if self.headless:
-                options.add_argument("--headless=new")
-            else:
-                options.add_argument("--start-maximized")
-            
-            # Automatic ChromeDriver installation
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            
-            # Set implicit wait
-            self.driver.implicitly_wait(10)
-            
-            # Hide webdriver
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            self.logger.info("WebDriver initialized successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
-            raise
-
-    def linkedin_login(self):
-        """Login to LinkedIn with improved error handling"""
-        if not self.email or not self.password:
-            self.logger.info("No login credentials provided")
-            return False
-        
-        for attempt in range(self.max_retries):
-            try:
-                self.logger.info(f"Attempting LinkedIn login (attempt {attempt + 1})")
-                self.driver.get("https://www.linkedin.com/login")
-                
-                # Wait for page to load
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.ID, "username"))
-                )
-                
-                # Input credentials
-                email_field = self.driver.find_element(By.ID, "username")
-                email_field.clear()
-                email_field.send_keys(self.email)
-                
-                password_field = self.driver.find_element(By.ID, "password")
-                password_field.clear()
-                password_field.send_keys(self.password)
-                
-                # Click login button
-                login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-                login_button.click()
-                
-                # Wait for successful login or CAPTCHA
-                try:
-                    WebDriverWait(self.driver, 20).until(
-                        lambda driver: "/feed/" in driver.current_url or "/challenge/" in driver.current_url
-                    )
-                    
-                    if "/challenge/" in self.driver.current_url:
-                        self.logger.warning("CAPTCHA or additional verification required. Please complete manually.")
-                        input("Press Enter after completing verification...")
-                    
-                    # Verify login success
-                    WebDriverWait(self.driver, 15).until(
-                        EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Search' or @placeholder='Cari']"))
-                    )
-                    
-                    self.logger.info("Login successful!")
-                    time.sleep(random.uniform(2, 4))
-                    return True
-                    
-                except TimeoutException:
-                    self.logger.warning("Login may have failed or requires additional verification")
-                    continue
-                    
-            except Exception as e:
-                self.logger.error(f"Login failed (attempt {attempt + 1}): {str(e)}")
-                if attempt == self.max_retries - 1:
-                    return False
-                time.sleep(random.uniform(3, 6))
-        
-        return False
-
-    def safe_find_elements(self, by, value, timeout=15, parent=None):
-        """Find elements with error handling"""
-        try:
-            if parent:
-                WebDriverWait(parent, timeout).until(
-                    EC.presence_of_element_located((by, value))
-                )
-                return parent.find_elements(by, value)
-            else:
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((by, value))
-                )
-                return self.driver.find_elements(by, value)
-        except TimeoutException:
-            self.logger.warning(f"Elements not found: {value}")
-            return []
-        except Exception as e:
-            self.logger.error(f"Error while finding elements: {str(e)}")
-            return []
-
-    def safe_get_text(self, element):
-        """Get element text with error handling"""
-        try:
-            return element.text.strip()
-        except Exception:
-            return ""
-
-    def safe_get_attribute(self, element, attribute):
-        """Get element attribute with error handling"""
-        try:
-            return element.get_attribute(attribute)
-        except Exception:
-            return ""
-
-    def scroll_page(self, scroll_pause_time=1, max_scrolls=None):
-        """Scroll page to load more content"""
-        max_scrolls = max_scrolls or self.max_scrolls
-        self.logger.info(f"Scrolling page (max {max_scrolls} times)...")
-        
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        scrolls = 0
-        no_change_count = 0
-        
-        while scrolls < max_scrolls and no_change_count < 3:
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
-            
-            # Calculate new height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if new_height == last_height:
-                no_change_count += 1
-                # Try clicking "See more" button if available
-                try:
-                    see_more_buttons = self.safe_find_elements(
-                        By.XPATH, 
-                        "//button[contains(@aria-label, 'Lihat selengkapnya') or contains(@aria-label, 'See more')]",
-                        timeout=2
-                    )
-                    if see_more_buttons:
-                        see_more_buttons[0].click()
-                        time.sleep(2)
-                except:
-                    pass
-            else:
-                no_change_count = 0
-                
-            last_height = new_height
-            scrolls += 1
-            
-            # Random delay to avoid bot detection
-            time.sleep(random.uniform(0.5, 2))
-
-    def save_profile_as_pdf(self):
-        """Save profile as PDF with HTML fallback"""
-        try:
-            self.logger.info("Saving profile as PDF...")
-            pdf_path = os.path.join(self.data_dir, "profile.pdf")
-            
-            # PDF configuration
-            try:
-                config = pdfkit.configuration(wkhtmltopdf='/usr/local/bin/wkhtmltopdf')
-            except:
-                config = None
-            
-            options = {
-                'quiet': '',
-                'page-size': 'A4',
-                'margin-top': '0mm',
-                'margin-right': '0mm',
-                'margin-bottom': '0mm',
-                'margin-left': '0mm',
-                'encoding': "UTF-8",
-            }
-            
-            # Use HTML as fallback if PDF fails
-            try:
-                if config:
-                    pdfkit.from_url(self.profile_url, pdf_path, configuration=config, options=options)
-                    self.logger.info(f"Profile PDF saved: {pdf_path}")
-                else:
-                    raise Exception("wkhtmltopdf not configured")
-            except Exception as e:
-                self.logger.warning(f"Failed to save PDF, switching to HTML: {str(e)}")
-                html_content = self.driver.page_source
-                html_path = os.path.join(self.data_dir, "profile.html")
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                self.logger.info(f"Profile HTML saved: {html_path}")
-            
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to save profile: {str(e)}")
-            return False
-
-    def scrape_basic_profile_info(self):
-        """Scrape basic profile information"""
-        try:
-            self.logger.info("Collecting basic profile info...")
-            self.driver.get(self.profile_url)
-            time.sleep(self.wait_time)
-            
-            profile_info = {}
-            
-            # Name
-            name_element = self.safe_find_elements(By.XPATH, "//h1[contains(@class, 'text-heading-xlarge')]")[0]
-            profile_info['name'] = self.safe_get_text(name_element)
-            
-            # Headline/Title
-            headline_element = self.safe_find_elements(By.XPATH, "//div[contains(@class, 'text-body-medium')]")[0]
-            profile_info['headline'] = self.safe_get_text(headline_element)
-            
-            # Location
-            location_element = self.safe_find_elements(
-                By.XPATH, 
-                "//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"
-            )
-            profile_info['location'] = self.safe_get_text(location_element[0]) if location_element else "Not found"
-            
-            # About section
-            try:
-                show_more = self.safe_find_elements(By.XPATH, "//button[contains(@aria-label, 'Lihat selengkapnya')]")
-                if show_more:
-                    show_more[0].click()
-                    time.sleep(1)
-                
-                about_element = self.safe_find_elements(By.XPATH, "//div[contains(@class, 'display-flex') and contains(@class, 'full-width')]")
-                profile_info['about'] = self.safe_get_text(about_element[0]) if about_element else "Not found"
-            except:
-                profile_info['about'] = "Not found"
-            
-            # Save data
-            self.save_to_json(profile_info, "profile_info.json")
-            self.logger.info(f"Successfully collected profile info: {profile_info['name']}")
-            
-            return profile_info
-            
-        except Exception as e:
-            self.logger.error(f"Failed to collect profile info: {str(e)}")
-            return {}
-
-    def download_profile_image(self):
-        """Download profile picture"""
-        try:
-            self.logger.info("Downloading profile picture...")
-            self.driver.get(self.profile_url)
-            time.sleep(self.wait_time)
-            
-            # Find profile image
-            img_element = self.safe_find_elements(
-                By.XPATH,
-                "//img[contains(@class, 'profile-photo-edit__preview')] | " +
-                "//img[contains(@class, 'pv-top-card-profile-picture')] | " +
-                "//img[contains(@alt, 'profile') or contains(@alt, 'Photo')]",
-                timeout=15
-            )
-            
-            if not img_element:
-                self.logger.warning("Profile picture not found")
-                return False
-            
-            img_url = self.safe_get_attribute(img_element[0], "src")
-            if not img_url:
-                self.logger.warning("Profile picture URL not found")
-                return False
-            
-            # Download high quality image
-            if '=' in img_url:  # URL with parameters
-                img_url = img_url.split('=')[0] + '=photo-size-800x800'
-            
-            response = requests.get(img_url, timeout=10)
-            if response.status_code == 200:
-                img_path = os.path.join(self.data_dir, "profile_picture.jpg")
-                with open(img_path, 'wb') as f:
-                    f.write(response.content)
-                self.logger.info(f"Profile picture downloaded: {img_path}")
-                return True
-            else:
-                self.logger.warning(f"Failed to download profile picture. Status code: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Failed to download profile picture: {str(e)}")
-            return False
-
-    def scrape_activity(self, activity_type="posts"):
-        """
-        Scrape activities (posts, comments, reactions)
-        
-        Parameters:
-            activity_type (str): posts, comments, reactions
-        """
-        type_names = {
-            "posts": "posts",
-            "comments": "comments",
-            "reactions": "reactions"
-        }
-        
-        self.logger.info(f"Collecting {type_names.get(activity_type, 'activities')}...")
-        activities = []
-        
-        try:
-            activity_url = f"{self.profile_url}/details/activity/"
-            self.driver.get(activity_url)
-            time.sleep(self.wait_time)
-            
-            # Select appropriate tab
-            if activity_type != "posts":
-                try:
-                    tab_button = self.safe_find_elements(
-                        By.XPATH,
-                        f"//button[contains(@aria-label, '{activity_type.capitalize()}') or contains(@aria-label, '{type_names.get(activity_type, '')}')]",
-                        timeout=15
-                    )[0]
-                    tab_button.click()
-                    time.sleep(self.wait_time)
-                except:
-                    self.logger.warning(f"{activity_type} tab not found")
-                    return []
-            
-            # Scroll to load content
-            self.scroll_page()
-            
-            # Find all activities
-            activities_container = self.safe_find_elements(
-                By.XPATH,
-                "//div[contains(@class, 'scaffold-finite-scroll__content')] | " +
-                "//div[contains(@class, 'profile-detail-activity')]",
-                timeout=15
-            )
-            
-            if not activities_container:
-                self.logger.warning("Activities container not found")
-                return []
-            
-            posts = self.safe_find_elements(
-                By.XPATH,
-                ".//div[contains(@class, 'update-components-text')] | " +
-                ".//div[contains(@class, 'feed-shared-update-v2')]",
-                parent=activities_container[0]
-            )
-            
-            for i, post in enumerate(posts, 1):
-                try:
-                    # Get link
-                    link_element = self.safe_find_elements(
-                        By.XPATH,
-                        ".//a[contains(@href, '/posts/') or contains(@href, '/activity-')]",
-                        parent=post
-                    )
-                    
-                    if not link_element:
-                        continue
-                        
-                    link = self.safe_get_attribute(link_element[0], "href").split('?')[0]
-                    
-                    # Get text
-                    text_content = ""
-                    text_element = self.safe_find_elements(
-                        By.XPATH,
-                        ".//div[contains(@class, 'feed-shared-text')] | " +
-                        ".//div[contains(@class, 'update-components-text')]",
-                        parent=post
-                    )
-                    
-                    if text_element:
-                        text_content = self.safe_get_text(text_element[0])
-                    
-                    # For comments, get comment text
-                    comment_text = ""
-                    if activity_type == "comments":
-                        comment_element = self.safe_find_elements(
-                            By.XPATH,
-                            ".//div[contains(@class, 'comment-text')]",
-                            parent=post
-                        )
-                        if comment_element:
-                            comment_text = self.safe_get_text(comment_element[0])
-                    
-                    activities.append({
-                        "no": i,
-                        "link": link,
-                        "text": text_content[:500] + "..." if len(text_content) > 500 else text_content,
-                        "comment": comment_text,
-                        "type": activity_type,
-                        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to process {activity_type} {i}: {str(e)}")
-                    continue
-            
-            # Save data
-            filename = f"{activity_type}.csv"
-            self.save_to_csv(activities, filename)
-            self.save_to_json(activities, f"{activity_type}.json")
-            
-            self.logger.info(f"Successfully collected {len(activities)} {type_names.get(activity_type, 'activities')}")
-            return activities
-            
-        except Exception as e:
-            self.logger.error(f"Failed to collect {type_names.get(activity_type, 'activities')}: {str(e)}")
-            return []
-
-    def scrape_connections(self, connection_type="connections"):
-        """
-        Scrape connections (connections, followers, following)
-        
-        Parameters:
-            connection_type (str): connections, followers, following
-        """
-        type_names = {
-            "connections": "connections",
-            "followers": "followers", 
-            "following": "following"
-        }
-        
-        self.logger.info(f"Collecting {type_names.get(connection_type, 'connections')}...")
-        connections = []
-        
-        try:
-            # Construct URL based on connection type
-            if connection_type == "connections":
-                connections_url = f"{self.profile_url}/details/connections/"
-            else:
-                connections_url = f"{self.profile_url}/details/{connection_type}/"
-            
-            self.driver.get(connections_url)
-            time.sleep(self.wait_time)
-            
-            # Check if login is required
-            if "authwall" in self.driver.current_url or "login" in self.driver.current_url:
-                self.logger.warning(f"Login required to access {type_names.get(connection_type)}")
-                return []
-            
-            # Scroll to load content
-            self.scroll_page()
-            
-            # Find all connections
-            items = self.safe_find_elements(
-                By.XPATH,
-                "//li[contains(@class, 'org-people-profile-card')] | " +
-                "//div[contains(@class, 'entity-result')]",
-                timeout=15
-            )
-            
-            for i, item in enumerate(items, 1):
-                try:
-                    # Get name and URL
-                    name_element = self.safe_find_elements(
-                        By.XPATH,
-                        ".//span[contains(@class, 'entity-result__title-text')]//a | " +
-                        ".//a[contains(@class, 'app-aware-link')]",
-                        parent=item
-                    )
-                    
-                    if not name_element:
-                        continue
-                        
-                    name = self.safe_get_text(name_element[0])
-                    url = self.safe_get_attribute(name_element[0], "href").split('?')[0]
-                    
-                    # Get headline if available
-                    headline = ""
-                    headline_element = self.safe_find_elements(
-                        By.XPATH,
-                        ".//div[contains(@class, 'entity-result__primary-subtitle')]",
-                        parent=item
-                    )
-                    if headline_element:
-                        headline = self.safe_get_text(headline_element[0])
-                    
-                    connections.append({
-                        "no": i,
-                        "name": name,
-                        "url": url,
-                        "headline": headline,
-                        "type": connection_type,
-                        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to process connection {i}: {str(e)}")
-                    continue
-            
-            # Save data
-            filename = f"{connection_type}.csv"
-            self.save_to_csv(connections, filename)
-            self.save_to_json(connections, f"{connection_type}.json")
-            
-            self.logger.info(f"Successfully collected {len(connections)} {type_names.get(connection_type)}")
-            return connections
-            
-        except Exception as e:
-            self.logger.error(f"Failed to collect {type_names.get(connection_type)}: {str(e)}")
-            return []
-
-    def scrape_interests(self):
-        """Scrape all interests (Top Voices, Companies, Groups, etc.)"""
-        self.logger.info("Collecting interests...")
-        all_interests = {}
-        
-        interest_types = {
-            "top-voices": "Top Voices",
-            "companies": "Companies",
-            "groups": "Groups",
-            "newsletters": "Newsletters",
-            "schools": "Schools"
-        }
-        
-        for itype, name in interest_types.items():
-            self.logger.info(f"Collecting interest: {name}...")
-            try:
-                url = f"{self.profile_url}/details/interests/?detail={itype}"
-                self.driver.get(url)
-                time.sleep(self.wait_time)
-                
-                # Scroll to load content
-                self.scroll_page(max_scrolls=5)
-                
-                # Find all interest items
-                items = self.safe_find_elements(
-                    By.XPATH,
-                    "//li[contains(@class, 'org-people-profile-card')] | " +
-                    "//div[contains(@class, 'entity-result')]",
-                    timeout=15
-                )
-                
-                interests = []
-                for i, item in enumerate(items, 1):
-                    try:
-                        # Get name and URL
-                        name_element = self.safe_find_elements(
-                            By.XPATH,
-                            ".//span[contains(@class, 'entity-result__title-text')]//a | " +
-                            ".//a[contains(@class, 'app-aware-link')]",
-                            parent=item
-                        )
-                        
-                        if not name_element:
-                            continue
-                            
-                        name = self.safe_get_text(name_element[0])
-                        url = self.safe_get_attribute(name_element[0], "href").split('?')[0]
-                        
-                        # Get description if available
-                        description = ""
-                        desc_element = self.safe_find_elements(
-                            By.XPATH,
-                            ".//div[contains(@class, 'entity-result__primary-subtitle')]",
-                            parent=item
-                        )
-                        if desc_element:
-                            description = self.safe_get_text(desc_element[0])
-                        
-                        interests.append({
-                            "no": i,
-                            "name": name,
-                            "url": url,
-                            "description": description,
-                            "type": itype,
-                            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
-                        })
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Failed to process interest {i}: {str(e)}")
-                        continue
-                
-                all_interests[itype] = interests
-                self.save_to_csv(interests, f"{itype}.csv")
-                self.save_to_json(interests, f"{itype}.json")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to collect interest {name}: {str(e)}")
-                continue
-        
-        return all_interests
-
-    def download_media(self):
-        """Download all uploaded media (images)"""
-        self.logger.info("Downloading uploaded media...")
-        try:
-            media_url = f"{self.profile_url}/details/media/"
-            self.driver.get(media_url)
-            time.sleep(self.wait_time)
-            
-            # Scroll to load content
-            self.scroll_page()
-            
-            # Find all images
-            images = self.safe_find_elements(
-                By.XPATH,
-                "//img[contains(@class, 'ivm-view-attr__img--centered')] | " +
-                "//img[contains(@class, 'image-item')]",
-                timeout=15
-            )
-            
-            media_dir = os.path.join(self.data_dir, "media")
-            os.makedirs(media_dir, exist_ok=True)
-            
-            downloaded = 0
-            for i, img in enumerate(images, 1):
-                try:
-                    img_url = img.get_attribute("src")
-                    if not img_url or not img_url.startswith('http'):
-                        continue
-                        
-                    # Download high quality image if possible
-                    if '=' in img_url:  # URL with parameters
-                        img_url = img_url.split('=')[0] + '=w800-h800'
-                    
-                    response = requests.get(img_url, timeout=10)
-                    if response.status_code == 200:
-                        img_path = os.path.join(media_dir, f"media_{i}.jpg")
-                        with open(img_path, 'wb') as f:
-                            f.write(response.content)
-                        downloaded += 1
-                except Exception as e:
-                    self.logger.warning(f"Failed to download media {i}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Successfully downloaded {downloaded} media items")
-            return downloaded
-            
-        except Exception as e:
-            self.logger.error(f"Failed to download media: {str(e)}")
-            return 0
-
-    def save_to_csv(self, data, filename):
-        """Save data to CSV file with error handling"""
-        if not data:
-            self.logger.warning(f"No data to save to {filename}")
-            return
-        
-        try:
-            filepath = os.path.join(self.data_dir, filename)
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-            self.logger.info(f"Data saved to {filepath}")
-        except Exception as e:
-            self.logger.error(f"Failed to save data to {filename}: {str(e)}")
-
-    def save_to_json(self, data, filename):
-        """Save data to JSON file with error handling"""
-        if not data:
-            self.logger.warning(f"No data to save to {filename}")
-            return
-        
-        try:
-            filepath = os.path.join(self.data_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"Data saved to {filepath}")
-        except Exception as e:
-            self.logger.error(f"Failed to save data to {filename}: {str(e)}")
-
-    def create_zip_archive(self):
-        """Create ZIP archive of all collected data"""
-        try:
-            self.logger.info("Creating ZIP archive of data...")
-            zip_path = os.path.join(os.path.dirname(self.data_dir), "linkedin_data_archive.zip")
-            
-            with ZipFile(zip_path, 'w') as zipf:
-                for root, _, files in os.walk(self.data_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, self.data_dir)
-                        zipf.write(file_path, arcname)
-            
-            self.logger.info(f"ZIP archive created: {zip_path}")
-            return zip_path
-        except Exception as e:
-            self.logger.error(f"Failed to create ZIP archive: {str(e)}")
-            return None
-
-    def create_summary_report(self, scraped_data):
-        """Create scraping summary report"""
-        try:
-            summary = {
-                "scraping_summary": {
-                    "profile_url": self.profile_url,
-                    "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "total_data_points": sum(len(data) for data in scraped_data.values() if isinstance(data, list))
-                },
-                "data_breakdown": {}
-            }
-            
-            for key, data in scraped_data.items():
-                if isinstance(data, list):
-                    summary["data_breakdown"][key] = len(data)
-                elif isinstance(data, dict):
-                    summary["data_breakdown"][key] = 1
-            
-            self.save_to_json(summary, "scraping_summary.json")
-            self.logger.info("Summary report created")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create summary report: {str(e)}")
-
-    def scrape_all(self):
-        """Run all scraping functions"""
-        scraped_data = {}
-        
-        try:
-            self.logger.info("Starting LinkedIn scraping process...")
-            self.start_driver()
-            
-            # Login if credentials provided
-            login_success = False
-            if self.email and self.password:
-                login_success = self.linkedin_login()
-            
-            # 1. Save profile as PDF/HTML
-            self.save_profile_as_pdf()
-            
-            # 2. Scrape basic profile info
-            scraped_data['profile_info'] = self.scrape_basic_profile_info()
-            
-            # 3. Download profile image
-            self.download_profile_image()
-            
-            # 4. Scrape activities
-            scraped_data['posts'] = self.scrape_activity("posts")
-            scraped_data['comments'] = self.scrape_activity("comments")
-            scraped_data['reactions'] = self.scrape_activity("reactions")
-            
-            # 5. Scrape connections (only if logged in)
-            if login_success:
-                scraped_data['connections'] = self.scrape_connections("connections")
-                scraped_data['followers'] = self.scrape_connections("followers")
-                scraped_data['following'] = self.scrape_connections("following")
-            else:
-                self.logger.warning("Skipping connections scraping (not logged in)")
-            
-            # 6. Scrape interests
-            scraped_data['interests'] = self.scrape_interests()
-            
-            # 7. Download media
-            scraped_data['media_downloaded'] = self.download_media()
-            
-            # 8. Create summary report
-            self.create_summary_report(scraped_data)
-            
-            # 9. Create ZIP archive
-            zip_path = self.create_zip_archive()
-            
-            self.logger.info(f"\n{'='*50}")
-            self.logger.info("SCRAPING COMPLETED!")
-            self.logger.info(f"All data saved to: {self.data_dir}")
-            if zip_path:
-                self.logger.info(f"ZIP archive created: {zip_path}")
-            self.logger.info(f"{'='*50}")
-            
-        except KeyboardInterrupt:
-            self.logger.info("Scraping stopped by user")
-        except Exception as e:
-            self.logger.error(f"Fatal error during scraping: {str(e)}")
-        finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.logger.info("WebDriver closed")
-                except Exception as e:
-                    self.logger.error(f"Failed to close WebDriver: {str(e)}")
-
-def main():
-    print("=" * 60)
-    print("     LINKEDIN PROFILE SCRAPER PRO - COMPLETE SOLUTION")
-    print("=" * 60)
-    print("IMPORTANT WARNING:")
-    print("- LinkedIn scraping may violate their Terms of Service")
-    print("- Use only for educational and ethical purposes")
-    print("- Respect privacy and rights of others")
-    print("- Use responsibly and legally")
-    print("=" * 60)
-    
-    try:
-        # Input profile URL
-        while True:
-            profile_url = input("\nEnter LinkedIn profile URL: ").strip()
-            if profile_url:
-                break
-            print("URL cannot be empty!")
-        
-        # Ask for login
-        use_login = input("Do you want to login to LinkedIn? (y/n): ").lower().strip() == 'y'
-        
-        email = None
-        password = None
-        
-        if use_login:
-            email = input("Enter LinkedIn email: ").strip()
-            password = input("Enter LinkedIn password: ").strip()
-            
-            if not email or not password:
-                print("Email and password required for login!")
-                use_login = False
-        
-        # Ask for headless mode
-        headless = input("Run in headless mode (no browser window)? (y/n): ").lower().strip() == 'y'
-        
-        # Confirm before starting
-        print(f"\nConfiguration:")
-        print(f"- Profile URL: {profile_url}")
-        print(f"- Login: {'Yes' if use_login else 'No'}")
-        print(f"- Headless Mode: {'Yes' if headless else 'No'}")
-        
-        confirm = input("\nProceed with scraping? (y/n): ").lower().strip()
-        if confirm != 'y':
-            print("Scraping cancelled.")
-            return
-        
-        # Start scraping
-        scraper = LinkedInScraperPro(profile_url, email, password, headless)
-        scraper.scrape_all()
-        
-    except KeyboardInterrupt:
-        print("\nProgram stopped by user.")
-    except Exception as e:
-        print(f"\nError occurred: {str(e)}")
-        print("Please try again or check your configuration.")
-
-if __name__ == "__main__":
-    main()
-
+# Linkedin-Creeps-Scrapper-V7
+
+import os
+import sys
+import time
+import argparse
+_import_started = time.perf_counter()
+import random
+import json
+import csv
+import gzip
+import base64
+import shutil
+import hashlib
+import tempfile
+import sqlite3
+import struct
+import threading
+import weakref
+import zipfile
+import zlib
+import logging
+import queue
+import copy
+import multiprocessing
+import cProfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from zipfile import ZipFile, ZipInfo
+from urllib.parse import urljoin, urlparse
+import io
+
+# Selenium is bound by load_selenium() when the browser first starts;
+# requests, PIL, pdfkit and webdriver_manager are imported by the code that uses them
+webdriver = By = WebDriverWait = EC = Service = None
+NoSuchElementException = TimeoutException = WebDriverException = None
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON backend
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional zstd compression of JSON output
+    zstandard = None
+
+try:
+    import psutil
+except ImportError:  # Optional RSS/CPU sampling in the run summary
+    psutil = None
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml is only needed for snapshot extraction
+    etree = None
+    lxml_html = None
+
+# Seconds spent importing this module (lazy imports are timed where they happen)
+IMPORT_SECONDS = round(time.perf_counter() - _import_started, 3)
+
+
+def load_selenium():
+    """Import Selenium on first use, returns the seconds it took (0 when already loaded)"""
+    global webdriver, By, WebDriverWait, EC, Service
+    global NoSuchElementException, TimeoutException, WebDriverException
+    if webdriver is not None:
+        return 0.0
+    
+    started = time.perf_counter()
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.service import Service
+    return round(time.perf_counter() - started, 3)
+
+
+# Tags that start a new line in rendered text (mirrors WebElement.text)
+BLOCK_TAGS = frozenset([
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tr", "ul"
+])
+
+# Screen-reader-only text, not rendered and therefore not part of WebElement.text
+SCREEN_READER_CLASSES = frozenset(["visually-hidden", "a11y-text", "sr-only"])
+
+
+# URL paths LinkedIn redirects to when a page needs a login
+LOGIN_WALL_PATHS = ("/authwall", "/login", "/checkpoint", "/uas/login")
+
+
+def is_login_wall(url):
+    """True when url is one of LinkedIn's login/authwall redirect targets"""
+    path = urlparse(url).path.rstrip("/")
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in LOGIN_WALL_PATHS)
+
+
+# Named selector fallback chains, declared in preferred order
+SELECTORS = {
+    "profile_name": ["//h1[contains(@class, 'text-heading-xlarge')]"],
+    "profile_headline": ["//div[contains(@class, 'text-body-medium')]"],
+    "profile_location": ["//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]"],
+    "about_show_more": ["//button[contains(@aria-label, 'Lihat selengkapnya')]"],
+    "about": ["//div[contains(@class, 'display-flex') and contains(@class, 'full-width')]"],
+    "profile_image": [
+        "//img[contains(@class, 'pv-top-card-profile-picture')]",
+        "//img[contains(@class, 'profile-photo-edit__preview')]",
+        "//img[contains(@alt, 'profile') or contains(@alt, 'Photo')]"
+    ],
+    "activity_container": [
+        "//div[contains(@class, 'scaffold-finite-scroll__content')]",
+        "//div[contains(@class, 'profile-detail-activity')]"
+    ],
+    "activity_item": [
+        ".//div[contains(@class, 'feed-shared-update-v2')]",
+        ".//div[contains(@class, 'update-components-text')]"
+    ],
+    "activity_link": [".//a[contains(@href, '/posts/') or contains(@href, '/activity-')]"],
+    "activity_text": [
+        ".//div[contains(@class, 'update-components-text')]",
+        ".//div[contains(@class, 'feed-shared-text')]"
+    ],
+    "comment_text": [".//div[contains(@class, 'comment-text')]"],
+    "entity_item": [
+        "//div[contains(@class, 'entity-result')]",
+        "//li[contains(@class, 'org-people-profile-card')]"
+    ],
+    "entity_name": [
+        ".//span[contains(@class, 'entity-result__title-text')]//a",
+        ".//a[contains(@class, 'app-aware-link')]"
+    ],
+    "entity_subtitle": [".//div[contains(@class, 'entity-result__primary-subtitle')]"],
+    "media_image": [
+        "//img[contains(@class, 'ivm-view-attr__img--centered')]",
+        "//img[contains(@class, 'image-item')]"
+    ],
+    "list_container": [
+        "//div[contains(@class, 'scaffold-finite-scroll__content')]",
+        "//div[contains(@class, 'profile-detail-activity')]",
+        "//main"
+    ],
+    "list_ready": [
+        "//div[contains(@class, 'scaffold-finite-scroll__content')]",
+        "//div[contains(@class, 'entity-result')]",
+        "//div[contains(@class, 'artdeco-empty-state')]"
+    ],
+    "see_more": ["//button[contains(@aria-label, 'Lihat selengkapnya') or contains(@aria-label, 'See more')]"]
+}
+
+# Scrolls once and resolves when the list container grows or stays quiet.
+# Arguments: container XPaths, see-more XPath, quiet period (ms), hard timeout (ms)
+SCROLL_OBSERVER_SCRIPT = """
+var containerXPaths = arguments[0], seeMoreXPath = arguments[1];
+var quietMs = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function first(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+
+var target = null;
+for (var i = 0; i < containerXPaths.length && !target; i++) {
+    target = first(containerXPaths[i]);
+}
+target = target || document.body;
+
+var finished = false, clicked = false, settleTimer = null, quietTimer = null, hardTimer = null;
+var observer = new MutationObserver(function (mutations) {
+    for (var m = 0; m < mutations.length; m++) {
+        for (var n = 0; n < mutations[m].addedNodes.length; n++) {
+            if (mutations[m].addedNodes[n].nodeType === 1) {
+                // New items landed, resolve once the current batch settles
+                clearTimeout(settleTimer);
+                settleTimer = setTimeout(function () { finish("grew"); }, 150);
+                return;
+            }
+        }
+    }
+});
+
+function finish(reason) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(settleTimer);
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done({
+        reason: reason,
+        items: target.getElementsByTagName("li").length || target.childElementCount,
+        height: document.body.scrollHeight
+    });
+}
+
+function onQuiet() {
+    var button = clicked ? null : first(seeMoreXPath);
+    if (button) {
+        clicked = true;
+        button.click();
+        quietTimer = setTimeout(onQuiet, quietMs);
+    } else {
+        finish("quiet");
+    }
+}
+
+observer.observe(target, {childList: true, subtree: true});
+quietTimer = setTimeout(onQuiet, quietMs);
+hardTimer = setTimeout(function () { finish("timeout"); }, timeoutMs);
+
+window.scrollTo(0, document.body.scrollHeight);
+if (target.lastElementChild) {
+    target.lastElementChild.scrollIntoView({block: "end"});
+}
+"""
+
+# Resolves "ready" once the page has fired load, every image is decoded and
+# web fonts are ready, or "timeout". Lazy images are switched to eager first.
+# Arguments: timeout (ms)
+PRINT_READY_SCRIPT = """
+var timeoutMs = arguments[0];
+var done = arguments[arguments.length - 1];
+var timer = setTimeout(function () { done("timeout"); }, timeoutMs);
+
+function pageLoaded() {
+    if (document.readyState === "complete") { return Promise.resolve(); }
+    return new Promise(function (resolve) { window.addEventListener("load", resolve, {once: true}); });
+}
+
+function imagesDecoded() {
+    var images = Array.prototype.slice.call(document.images);
+    return Promise.all(images.map(function (img) {
+        img.loading = "eager";
+        if (!img.complete) {
+            return new Promise(function (resolve) {
+                img.addEventListener("load", resolve, {once: true});
+                img.addEventListener("error", resolve, {once: true});
+            });
+        }
+        return img.decode ? img.decode().catch(function () {}) : null;
+    }));
+}
+
+pageLoaded()
+    .then(imagesDecoded)
+    .then(function () { return document.fonts ? document.fonts.ready : null; })
+    .then(function () { clearTimeout(timer); done("ready"); });
+"""
+
+# Returns outerHTML of list items not returned before and marks them as seen
+# (null while the container is missing).
+# Arguments: container XPaths (empty for the whole document), item XPath
+COLLECT_NEW_ITEMS_SCRIPT = """
+var containerXPaths = arguments[0], itemXPath = arguments[1];
+
+var context = containerXPaths.length ? null : document;
+for (var i = 0; i < containerXPaths.length && !context; i++) {
+    context = document.evaluate(containerXPaths[i], document, null,
+                                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+if (!context) { return null; }
+
+var nodes = document.evaluate(itemXPath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var fresh = [];
+for (var n = 0; n < nodes.snapshotLength; n++) {
+    var node = nodes.snapshotItem(n);
+    if (node.hasAttribute("data-scraper-seen")) { continue; }
+    node.setAttribute("data-scraper-seen", "1");
+    fresh.push(node.outerHTML);
+}
+return fresh;
+"""
+
+
+class SelectorRegistry:
+    """
+    Selector fallback chains with per-selector hit statistics
+
+    Statistics are persisted as JSON so that the selector that matched most
+    reliably in recent runs is tried first. The score is an exponentially
+    weighted hit rate, and a selector that missed MISS_STREAK_LIMIT times in a
+    row (e.g. after markup drift) goes behind the others until it hits again.
+    """
+
+    SCORE_WEIGHT = 0.2
+    MISS_STREAK_LIMIT = 3
+
+    def __init__(self, selectors=None, stats_path=None):
+        self.selectors = selectors or SELECTORS
+        self.stats_path = stats_path
+        self.stats = {}
+        self.load()
+
+    def load(self):
+        """Load statistics from previous runs"""
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def save(self):
+        """Persist statistics for the next run"""
+        if not self.stats_path:
+            return
+        with open(self.stats_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, indent=2)
+
+    def union(self, field):
+        """All alternatives of a field as a single XPath union"""
+        return " | ".join(self.selectors[field])
+
+    def candidates(self, field):
+        """Selectors of a field, historically winning selector first"""
+        alternatives = self.selectors[field]
+        field_stats = self.stats.get(field, {})
+        
+        def rank(item):
+            index, xpath = item
+            entry = field_stats.get(xpath, {})
+            hits = entry.get("hits", 0)
+            latency = entry.get("hit_latency", 0.0) / hits if hits else float("inf")
+            demoted = entry.get("miss_streak", 0) >= self.MISS_STREAK_LIMIT
+            return (demoted, -self._score(entry), latency, index)
+        
+        return [xpath for _, xpath in sorted(enumerate(alternatives), key=rank)]
+
+    @staticmethod
+    def _score(entry):
+        """Recency-weighted hit rate (plain hit rate for statistics saved without one)"""
+        if "score" in entry:
+            return entry["score"]
+        attempts = entry.get("hits", 0) + entry.get("misses", 0)
+        return entry.get("hits", 0) / attempts if attempts else 0.5
+
+    def record(self, field, xpath, found, latency):
+        """Record the outcome and latency of one selector attempt"""
+        entry = self.stats.setdefault(field, {}).setdefault(
+            xpath, {"hits": 0, "misses": 0, "hit_latency": 0.0}
+        )
+        entry["score"] = self._score(entry) * (1 - self.SCORE_WEIGHT) + (self.SCORE_WEIGHT if found else 0.0)
+        if found:
+            entry["hits"] += 1
+            entry["hit_latency"] += latency
+            entry["miss_streak"] = 0
+        else:
+            entry["misses"] += 1
+            entry["miss_streak"] = entry.get("miss_streak", 0) + 1
+
+
+class PageSnapshot:
+    """DOM of a loaded page, shared by every stage that reads the same URL"""
+
+    def __init__(self, url, html, outcome):
+        self.url = url
+        self.html = html
+        self.outcome = outcome
+        self.loaded_at = time.time()
+
+
+class SnapshotExtractor:
+    """
+    Extract list rows from a single HTML snapshot with compiled XPath expressions
+
+    The XPath expressions come from the same selector registry as the live
+    WebDriver lookups.
+    """
+
+    def __init__(self, registry=None):
+        if etree is None:
+            raise ImportError("lxml is required for snapshot extraction")
+        
+        # In-process evaluation is cheap, so list fields run all alternatives as one union
+        registry = registry or SelectorRegistry()
+        self.registry = registry
+        self._compiled = {}
+        self.activity_items = etree.XPath(registry.union("activity_item"))
+        self.activity_link = etree.XPath(registry.union("activity_link"))
+        self.activity_text = etree.XPath(registry.union("activity_text"))
+        self.comment_text = etree.XPath(registry.union("comment_text"))
+        self.entity_items = etree.XPath(registry.union("entity_item"))
+        self.entity_name = etree.XPath(registry.union("entity_name"))
+        self.entity_subtitle = etree.XPath(registry.union("entity_subtitle"))
+
+    def parse(self, html):
+        """Parse a full page or an outerHTML fragment"""
+        return lxml_html.fromstring(html)
+
+    def compiled(self, xpath):
+        """Compiled XPath for a selector, compiled once per run"""
+        compiled = self._compiled.get(xpath)
+        if compiled is None:
+            compiled = self._compiled[xpath] = etree.XPath(xpath)
+        return compiled
+
+    def find_field(self, root, field):
+        """First non-empty match of a registry field, best selector first"""
+        for xpath in self.registry.candidates(field):
+            found = self.compiled(xpath)(root)
+            if found:
+                return found
+        return []
+
+    def text_of(self, element):
+        """Approximate WebElement.text: text content with block-level line breaks"""
+        parts = []
+        self._collect_text(element, parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    @staticmethod
+    def _is_hidden(element):
+        """
+        Nodes WebElement.text leaves out: hidden attribute, inline display:none or
+        visibility:hidden, and screen-reader-only copies (LinkedIn renders names
+        twice, a visible aria-hidden span plus a visually-hidden one)
+        """
+        if element.get("hidden") is not None:
+            return True
+        if SCREEN_READER_CLASSES.intersection((element.get("class") or "").split()):
+            return True
+        style = (element.get("style") or "").replace(" ", "").lower()
+        return "display:none" in style or "visibility:hidden" in style
+
+    def _collect_text(self, element, parts):
+        tag = element.tag if isinstance(element.tag, str) else ""
+        if not tag or tag in ("script", "style", "template") or self._is_hidden(element):
+            return
+        
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if element.text:
+            parts.append(element.text)
+        for child in element:
+            self._collect_text(child, parts)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    def href_of(self, element, base_url):
+        """Absolute href, like WebElement.get_attribute('href')"""
+        href = element.get("href")
+        return urljoin(base_url, href) if href else ""
+
+    def extract_profile(self, html):
+        """Basic profile fields from a profile page snapshot"""
+        root = self.parse(html)
+        profile_info = {}
+        
+        for key, field, required in (("name", "profile_name", True),
+                                     ("headline", "profile_headline", True),
+                                     ("location", "profile_location", False),
+                                     ("about", "about", False)):
+            found = self.find_field(root, field)
+            if not found and required:
+                raise ValueError(f"Profile {key} not found")
+            profile_info[key] = self.text_of(found[0]) if found else "Not found"
+        
+        return profile_info
+
+    def extract_image_src(self, html, base_url, field="profile_image"):
+        """Absolute src of the first image matching a registry field"""
+        found = self.find_field(self.parse(html), field)
+        if not found:
+            return None
+        src = found[0].get("src")
+        return urljoin(base_url, src) if src else ""
+
+    def activity_fields(self, post, base_url, activity_type, skip_text=None):
+        """(link, text, comment) of one activity item, or None if it has no link"""
+        link_element = self.activity_link(post)
+        if not link_element:
+            return None
+        
+        link = self.href_of(link_element[0], base_url).split('?')[0]
+        
+        # Text of links in skip_text is already stored
+        text_content = None
+        if not skip_text or link not in skip_text:
+            text_element = self.activity_text(post)
+            text_content = self.text_of(text_element[0]) if text_element else ""
+        
+        comment_text = ""
+        if activity_type == "comments":
+            comment_element = self.comment_text(post)
+            if comment_element:
+                comment_text = self.text_of(comment_element[0])
+        
+        return link, text_content, comment_text
+
+    def entity_fields(self, item, base_url):
+        """(name, url, subtitle) of one entity card, or None if it has no name link"""
+        name_element = self.entity_name(item)
+        if not name_element:
+            return None
+        
+        name = self.text_of(name_element[0])
+        url = self.href_of(name_element[0], base_url).split('?')[0]
+        
+        subtitle_element = self.entity_subtitle(item)
+        subtitle = self.text_of(subtitle_element[0]) if subtitle_element else ""
+        
+        return name, url, subtitle
+
+    def extract_image_srcs(self, html, base_url, field="media_image"):
+        """Absolute src of every image matching a registry field"""
+        return [urljoin(base_url, img.get("src")) for img in self.find_field(self.parse(html), field) if img.get("src")]
+
+    def extract_activities(self, html, base_url, activity_type, skip_text=None, container_field=None):
+        """
+        Yield (no, link, text, comment) for every activity item in the snapshot
+        
+        With container_field, html is a full page and only items inside the
+        first matching container are extracted.
+        """
+        root = self.parse(html)
+        if container_field:
+            container = self.find_field(root, container_field)
+            if not container:
+                return
+            root = container[0]
+        for i, post in enumerate(self.activity_items(root), 1):
+            fields = self.activity_fields(post, base_url, activity_type, skip_text)
+            if fields:
+                yield (i,) + fields
+
+    def extract_entities(self, html, base_url):
+        """Yield (no, name, url, subtitle) for every entity card in the snapshot"""
+        for i, item in enumerate(self.entity_items(self.parse(html)), 1):
+            fields = self.entity_fields(item, base_url)
+            if fields:
+                yield (i,) + fields
+
+
+# URL patterns per resource group, in Network.setBlockedURLs wildcard syntax
+BLOCK_PATTERNS = {
+    "images": [
+        "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+        "*media.licdn.com/dms/image/*"
+    ],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.ts", "*dms.licdn.com/playlist/*"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf"],
+    "tracking": [
+        "*px.ads.linkedin.com/*", "*linkedin.com/li/track*",
+        "*google-analytics.com/*", "*doubleclick.net/*"
+    ]
+}
+
+# Resource groups blocked by each profile
+RESOURCE_PROFILES = {
+    "full": [],
+    "print": ["media", "tracking"],
+    "images": ["media", "fonts", "tracking"],
+    "text": ["images", "media", "fonts", "tracking"]
+}
+
+# Only the profile page (PDF, photo) and the media stage need images, the PDF also fonts
+STAGE_RESOURCE_PROFILES = {
+    "profile_pdf": "print",
+    "profile_info": "images",
+    "profile_image": "images",
+    "posts": "text",
+    "comments": "text",
+    "reactions": "text",
+    "connections": "text",
+    "followers": "text",
+    "following": "text",
+    "interests": "text",
+    "media": "images"
+}
+
+
+class ResourceMonitor:
+    """
+    Apply resource blocking profiles and account network bytes per stage
+
+    Blocking uses Network.setBlockedURLs. Transfers and blocked requests are
+    read from the ChromeDriver performance log. Bytes saved are estimated
+    from the average size of each resource type seen when it was allowed.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.profile = None
+        self.request_types = {}
+        self.type_sizes = {}
+        self.driver.execute_cdp_cmd("Network.enable", {})
+
+    def apply(self, profile):
+        """Switch to a resource profile"""
+        if profile == self.profile:
+            return
+        patterns = [pattern for group in RESOURCE_PROFILES[profile] for pattern in BLOCK_PATTERNS[group]]
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        self.profile = profile
+
+    def collect(self):
+        """Drain the performance log into transfer and block statistics"""
+        transferred = {}
+        blocked = {}
+        
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
+            
+            if method == "Network.responseReceived":
+                self.request_types[params["requestId"]] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                rtype = self.request_types.pop(params["requestId"], "Other")
+                size = params.get("encodedDataLength", 0)
+                transferred[rtype] = transferred.get(rtype, 0) + size
+                total, count = self.type_sizes.get(rtype, (0, 0))
+                self.type_sizes[rtype] = (total + size, count + 1)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                rtype = params.get("type", "Other")
+                blocked[rtype] = blocked.get(rtype, 0) + 1
+        
+        saved = 0
+        for rtype, count in blocked.items():
+            total, seen = self.type_sizes.get(rtype, (0, 0))
+            if seen:
+                saved += count * total // seen
+        
+        return {
+            "profile": self.profile,
+            "bytes_transferred": sum(transferred.values()),
+            "bytes_by_type": transferred,
+            "blocked_requests": blocked,
+            "bytes_saved_estimate": saved
+        }
+
+
+class LookupBudget:
+    """Time budget for blocking element lookups within one scraping stage"""
+
+    def __init__(self, stage, budget=None):
+        self.stage = stage
+        self.budget = budget
+        self.started = time.perf_counter()
+        self.lookups = 0
+        self.misses = 0
+        self.wait_time = 0.0
+        self.miss_time = 0.0
+        self.sleep_time = 0.0
+
+    def remaining(self):
+        """Seconds of blocking wait left in this stage (None means unlimited)"""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.wait_time)
+
+    def record(self, elapsed, found):
+        """Account for one blocking lookup"""
+        self.lookups += 1
+        self.wait_time += elapsed
+        if not found:
+            self.misses += 1
+            self.miss_time += elapsed
+
+    def report(self):
+        """Stage lookup statistics"""
+        return {
+            "stage": self.stage,
+            "wall_time": round(time.perf_counter() - self.started, 3),
+            "budget": self.budget,
+            "lookups": self.lookups,
+            "misses": self.misses,
+            "wait_time": round(self.wait_time, 3),
+            "miss_wait_time": round(self.miss_time, 3),
+            "sleep_time": round(self.sleep_time, 3)
+        }
+
+
+class WebDriverCommandCounter:
+    """
+    Counts WebDriver commands and their latency per stage
+
+    Wraps driver.execute, through which every Selenium call (find, click,
+    execute_script, CDP commands, ...) reaches chromedriver.
+    """
+
+    def __init__(self, driver):
+        self.stage = None
+        self.stats = {}
+        self._execute = driver.execute
+        driver.execute = self._counted
+
+    def _counted(self, driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return self._execute(driver_command, params)
+        finally:
+            stats = self.stats.setdefault(self.stage, {"commands": 0, "command_time": 0.0, "by_command": {}})
+            stats["commands"] += 1
+            stats["command_time"] += time.perf_counter() - started
+            stats["by_command"][driver_command] = stats["by_command"].get(driver_command, 0) + 1
+
+    def report(self, stage):
+        stats = self.stats.get(stage, {"commands": 0, "command_time": 0.0, "by_command": {}})
+        return {
+            "commands": stats["commands"],
+            "command_time": round(stats["command_time"], 3),
+            "by_command": dict(sorted(stats["by_command"].items(), key=lambda item: -item[1]))
+        }
+
+
+class ResourceSampler:
+    """
+    Background sampling of RSS and CPU per stage (needs psutil)
+
+    Samples this Python process and the browser process tree (chromedriver
+    and every Chrome process below it) every `interval` seconds and keeps
+    peak and average values for the stage that was running.
+    """
+
+    def __init__(self, browser_pid=None, interval=1.0):
+        if psutil is None:
+            raise ImportError("psutil is not installed")
+        self.interval = interval
+        self.stage = None
+        self.stats = {}
+        self._process = psutil.Process()
+        self._browser = psutil.Process(browser_pid) if browser_pid else None
+        self._browser_tree = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        
+        # cpu_percent() measures since the previous call, prime the counters
+        self._process.cpu_percent(None)
+
+    def _browser_processes(self):
+        """Current browser processes, reusing Process objects for CPU deltas"""
+        if self._browser is None:
+            return []
+        processes = []
+        for process in [self._browser] + self._browser.children(recursive=True):
+            if process.pid not in self._browser_tree:
+                self._browser_tree[process.pid] = process
+                process.cpu_percent(None)
+            processes.append(self._browser_tree[process.pid])
+        return processes
+
+    def sample(self):
+        """Take one sample and add it to the current stage"""
+        python_rss = self._process.memory_info().rss
+        python_cpu = self._process.cpu_percent(None)
+        browser_rss = 0
+        browser_cpu = 0.0
+        for process in self._browser_processes():
+            try:
+                browser_rss += process.memory_info().rss
+                browser_cpu += process.cpu_percent(None)
+            except psutil.Error:
+                self._browser_tree.pop(process.pid, None)
+        
+        with self._lock:
+            stats = self.stats.setdefault(self.stage, {
+                "samples": 0, "python_rss_peak": 0, "python_cpu_sum": 0.0,
+                "browser_rss_peak": 0, "browser_cpu_sum": 0.0
+            })
+            stats["samples"] += 1
+            stats["python_rss_peak"] = max(stats["python_rss_peak"], python_rss)
+            stats["python_cpu_sum"] += python_cpu
+            stats["browser_rss_peak"] = max(stats["browser_rss_peak"], browser_rss)
+            stats["browser_cpu_sum"] += browser_cpu
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except psutil.Error:
+                pass
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def report(self, stage):
+        with self._lock:
+            stats = self.stats.get(stage)
+        if not stats:
+            return None
+        samples = stats["samples"]
+        return {
+            "samples": samples,
+            "python_rss_peak_mb": round(stats["python_rss_peak"] / 1048576, 1),
+            "python_cpu_avg": round(stats["python_cpu_sum"] / samples, 1),
+            "browser_rss_peak_mb": round(stats["browser_rss_peak"] / 1048576, 1),
+            "browser_cpu_avg": round(stats["browser_cpu_sum"] / samples, 1)
+        }
+
+
+class JSONSerializer:
+    """
+    JSON encoding backend selected per run
+
+    Supports the stdlib encoder or orjson ("auto" picks orjson when it is
+    installed), pretty or compact layout, and optional gzip or zstd
+    compression of the output file. Serialize time and bytes written are
+    accumulated in stats.
+    """
+
+    SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, backend="auto", pretty=True, compression=None):
+        if backend == "auto":
+            backend = "orjson" if orjson is not None else "stdlib"
+        if backend == "orjson" and orjson is None:
+            raise ImportError("orjson is not installed")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard is not installed")
+        if compression not in self.SUFFIXES:
+            raise ValueError(f"Unsupported JSON compression: {compression}")
+        
+        self.backend = backend
+        self.pretty = pretty
+        self.compression = compression
+        self.suffix = self.SUFFIXES[compression]
+        self.stats = {"files": 0, "serialize_time": 0.0, "bytes_written": 0}
+
+    def dumps(self, data, pretty=None):
+        """Encode data as UTF-8 JSON bytes"""
+        pretty = self.pretty if pretty is None else pretty
+        started = time.perf_counter()
+        if self.backend == "orjson":
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        elif pretty:
+            encoded = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        else:
+            encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        self.stats["serialize_time"] += time.perf_counter() - started
+        return encoded
+
+    def open(self, path):
+        """Binary file object for path, compressing if configured"""
+        if self.compression == "gzip":
+            return gzip.open(path, 'wb', compresslevel=6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+        return open(path, 'wb')
+
+    def record(self, path):
+        """Account a finished output file"""
+        self.stats["files"] += 1
+        self.stats["bytes_written"] += os.path.getsize(path)
+
+    def dump(self, data, path):
+        """Write data to path via a temporary file, returns the final path"""
+        path += self.suffix
+        with self.open(path + ".part") as f:
+            f.write(self.dumps(data))
+        os.replace(path + ".part", path)
+        self.record(path)
+        return path
+
+
+class RowWriter:
+    """
+    Append-only writer for dict rows
+
+    Rows are buffered and flushed in batches to '<path>.part', which is renamed
+    to the final path on close, so an interrupted run never leaves a truncated
+    file under the final name. Nothing is written for an empty dataset.
+    """
+
+    def __init__(self, path, batch_size=100):
+        self.path = path
+        self.tmp_path = path + ".part"
+        self.batch_size = batch_size
+        self.count = 0
+        self.bytes_written = 0
+        self._pending = []
+        self._file = None
+
+    def append(self, row):
+        """Queue one row, flushing when the batch is full"""
+        self._pending.append(row)
+        self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write queued rows to the temporary file"""
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = self._open()
+            self._write_header(self._pending[0])
+        self._write_rows(self._pending)
+        self._pending = []
+        self._file.flush()
+
+    def close(self):
+        """Flush and move the file into place, returns False if there were no rows"""
+        self.flush()
+        if self._file is None:
+            return False
+        
+        self._write_footer()
+        self._file.close()
+        self._file = None
+        os.replace(self.tmp_path, self.path)
+        self.bytes_written = os.path.getsize(self.path)
+        return True
+
+    def discard(self):
+        """Drop unwritten rows and the temporary file after a failed write"""
+        self._pending = []
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def _open(self):
+        return open(self.tmp_path, 'w', newline='', encoding='utf-8')
+
+    def _write_header(self, first_row):
+        pass
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def _write_footer(self):
+        pass
+
+
+class CSVRowWriter(RowWriter):
+    """Incremental CSV writer, columns taken from the first row"""
+
+    def _write_header(self, first_row):
+        self._writer = csv.DictWriter(self._file, fieldnames=first_row.keys())
+        self._writer.writeheader()
+
+    def _write_rows(self, rows):
+        self._writer.writerows(rows)
+
+
+class JSONRowWriter(RowWriter):
+    """Base for JSON row writers encoding through a JSONSerializer"""
+
+    def __init__(self, path, serializer, batch_size=100):
+        super().__init__(path + serializer.suffix, batch_size)
+        self.serializer = serializer
+
+    def _open(self):
+        return self.serializer.open(self.tmp_path)
+
+    def close(self):
+        written = super().close()
+        if written:
+            self.serializer.record(self.path)
+        return written
+
+
+class NDJSONRowWriter(JSONRowWriter):
+    """Newline-delimited JSON writer, one compact object per line"""
+
+    def _write_rows(self, rows):
+        self._file.write(b"".join(self.serializer.dumps(row, pretty=False) + b"\n" for row in rows))
+
+
+class JSONArrayRowWriter(JSONRowWriter):
+    """Streams rows into a JSON array, laid out like the serializer's dump of a list"""
+
+    def _write_header(self, first_row):
+        self._file.write(b"[")
+        self._separator = b"\n" if self.serializer.pretty else b""
+
+    def _write_rows(self, rows):
+        chunks = []
+        for row in rows:
+            if self.serializer.pretty:
+                item = b"  " + self.serializer.dumps(row).replace(b"\n", b"\n  ")
+            else:
+                item = self.serializer.dumps(row)
+            chunks.append(self._separator + item)
+            self._separator = b",\n" if self.serializer.pretty else b","
+        self._file.write(b"".join(chunks))
+
+    def _write_footer(self):
+        self._file.write(b"\n]" if self.serializer.pretty else b"]")
+
+
+class SQLiteResultStore:
+    """
+    Single-file SQLite store for every dataset of a run
+
+    Rows are inserted in batched transactions with executemany. Re-collecting
+    a dataset for the same profile replaces its previous rows.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS profile (
+        profile_url TEXT PRIMARY KEY,
+        name TEXT,
+        headline TEXT,
+        location TEXT,
+        about TEXT,
+        scraped_at TEXT
+    );
+    CREATE TABLE IF NOT EXISTS activities (
+        id INTEGER PRIMARY KEY,
+        profile_url TEXT NOT NULL,
+        no INTEGER,
+        link TEXT,
+        text TEXT,
+        comment TEXT,
+        type TEXT NOT NULL,
+        scraped_at TEXT,
+        first_seen TEXT,
+        last_seen TEXT,
+        post_id TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_activities_type ON activities (profile_url, type);
+    CREATE INDEX IF NOT EXISTS idx_activities_link ON activities (link);
+    CREATE TABLE IF NOT EXISTS activity_posts (
+        id INTEGER PRIMARY KEY,
+        profile_url TEXT NOT NULL,
+        post_id TEXT,
+        link TEXT,
+        text TEXT,
+        type TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_activity_posts_type ON activity_posts (profile_url, type);
+    CREATE TABLE IF NOT EXISTS connections (
+        id INTEGER PRIMARY KEY,
+        profile_url TEXT NOT NULL,
+        no INTEGER,
+        name TEXT,
+        url TEXT,
+        headline TEXT,
+        type TEXT NOT NULL,
+        scraped_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_connections_type ON connections (profile_url, type);
+    CREATE INDEX IF NOT EXISTS idx_connections_url ON connections (url);
+    CREATE TABLE IF NOT EXISTS interests (
+        id INTEGER PRIMARY KEY,
+        profile_url TEXT NOT NULL,
+        no INTEGER,
+        name TEXT,
+        url TEXT,
+        description TEXT,
+        type TEXT NOT NULL,
+        scraped_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_interests_type ON interests (profile_url, type);
+    """
+
+    # Row columns per table, in the order the scraper builds them
+    COLUMNS = {
+        "activities": ["no", "link", "text", "comment", "type", "scraped_at", "first_seen", "last_seen", "post_id"],
+        "activity_posts": ["post_id", "link", "text", "type"],
+        "connections": ["no", "name", "url", "headline", "type", "scraped_at"],
+        "interests": ["no", "name", "url", "description", "type", "scraped_at"]
+    }
+
+    # Columns only filled by some runs (dedupe_activities, refresh); exports leave them out when unused
+    OPTIONAL_COLUMNS = {
+        "activities": ("link", "text", "first_seen", "last_seen", "post_id")
+    }
+
+    # Profile fields as in profile_info.json
+    PROFILE_COLUMNS = ["name", "headline", "location", "about"]
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        """Open connection, reopened on demand after close()"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            
+            # Databases from older versions lack the newer columns
+            for table, columns in self.COLUMNS.items():
+                existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+                for column in columns:
+                    if column not in existing:
+                        self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        return self._conn
+
+    @staticmethod
+    def table_for(dataset):
+        """Table holding a dataset (posts, followers, companies, ...)"""
+        if dataset in ("posts", "comments", "reactions"):
+            return "activities"
+        if dataset == "activity_posts":
+            return "activity_posts"
+        if dataset in ("connections", "followers", "following"):
+            return "connections"
+        return "interests"
+
+    def insert(self, profile_url, dataset, rows, replace=False):
+        """Insert a batch of rows in one transaction, optionally replacing the dataset"""
+        table = self.table_for(dataset)
+        columns = self.COLUMNS[table]
+        sql = (f"INSERT INTO {table} (profile_url, {', '.join(columns)}) "
+               f"VALUES (?, {', '.join('?' for _ in columns)})")
+        
+        with self.lock, self.conn:
+            if replace:
+                self.conn.execute(f"DELETE FROM {table} WHERE profile_url = ? AND type = ?", (profile_url, dataset))
+            self.conn.executemany(sql, [
+                [profile_url] + [row.get(column, dataset if column == "type" else None) for column in columns]
+                for row in rows
+            ])
+
+    def save_profile(self, profile_url, profile_info):
+        """Insert or replace the basic profile row"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO profile (profile_url, name, headline, location, about, scraped_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (profile_url, profile_info.get('name'), profile_info.get('headline'),
+                 profile_info.get('location'), profile_info.get('about'), time.strftime("%Y-%m-%d %H:%M:%S"))
+            )
+
+    def profile(self, profile_url):
+        """The basic profile row as a dict, None if it was not saved"""
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(self.PROFILE_COLUMNS)} FROM profile WHERE profile_url = ?", (profile_url,)
+            ).fetchone()
+        return dict(zip(self.PROFILE_COLUMNS, row)) if row else None
+
+    def datasets(self, profile_url):
+        """Names of the datasets stored for a profile"""
+        names = []
+        with self.lock:
+            for table in self.COLUMNS:
+                cursor = self.conn.execute(
+                    f"SELECT DISTINCT type FROM {table} WHERE profile_url = ? ORDER BY type", (profile_url,)
+                )
+                names.extend(row[0] for row in cursor)
+        return names
+
+    def rows(self, profile_url, dataset, drop_unused=False):
+        """Rows of a dataset as dicts in insertion order, drop_unused leaves out optional columns null in every row"""
+        table = self.table_for(dataset)
+        columns = self.COLUMNS[table]
+        with self.lock:
+            cursor = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table} WHERE profile_url = ? AND type = ? ORDER BY id",
+                (profile_url, dataset)
+            )
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        if drop_unused:
+            unused = [column for column in self.OPTIONAL_COLUMNS.get(table, ())
+                      if all(row[column] is None for row in rows)]
+            for row in rows:
+                for column in unused:
+                    del row[column]
+        return rows
+
+    def close(self):
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SQLiteRowWriter(RowWriter):
+    """Batches dataset rows into SQLiteResultStore transactions"""
+
+    def __init__(self, store, profile_url, dataset, batch_size=500):
+        super().__init__(store.path, batch_size)
+        self.store = store
+        self.profile_url = profile_url
+        self.dataset = dataset
+        self._started = False
+
+    def flush(self):
+        if not self._pending:
+            return
+        # The first batch replaces rows from an earlier run of the same dataset
+        self.store.insert(self.profile_url, self.dataset, self._pending, replace=not self._started)
+        self._started = True
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        return self._started
+
+
+class DatasetWriter:
+    """
+    Feeds the rows of one dataset to its CSV and JSON writers
+
+    With a defer callable (the scraper's background pipeline) rows are handed
+    over in batches and written on a lane of their own, off the browser thread.
+    Any failed write sets `failed`; the stage that wrote the dataset then
+    counts as failed and no partial file is left behind.
+    """
+
+    def __init__(self, name, writers, logger, defer=None, batch_size=100):
+        self.name = name
+        self.writers = writers
+        self.logger = logger
+        self.defer = defer
+        self.batch_size = batch_size
+        self.closed = False
+        self.failed = False
+        self._count = 0
+        self._batch = []
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def bytes_written(self):
+        return sum(writer.bytes_written for writer in self.writers)
+
+    def append(self, row):
+        self._count += 1
+        if not self.defer:
+            self._write_rows([row])
+            return
+        
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            self._hand_over()
+
+    def _hand_over(self):
+        batch, self._batch = self._batch, []
+        self.defer(f"{self.name} rows", self._write_rows, batch, lane=self.name)
+
+    def _write_rows(self, rows):
+        try:
+            for row in rows:
+                for writer in self.writers:
+                    writer.append(row)
+        except Exception:
+            self.failed = True
+            raise
+        return []
+
+    def close(self):
+        """Finalize every output file of the dataset"""
+        if self.closed:
+            return
+        self.closed = True
+        
+        if self.defer:
+            if self._batch:
+                self._hand_over()
+            self.defer(f"{self.name} close", self._close_writers, lane=self.name)
+        else:
+            self._close_writers()
+
+    def _close_writers(self):
+        """Close the writers, returns the paths of the files written (None if any write failed)"""
+        paths = []
+        rows_failed = self.failed
+        for writer in self.writers:
+            filename = os.path.basename(writer.path)
+            if rows_failed:
+                # Rows are missing, keep the previous file rather than a partial one
+                writer.discard()
+                self.logger.error(f"Failed to save data to {filename}: rows could not be written")
+                continue
+            try:
+                if writer.close():
+                    paths.append(writer.path)
+                    self.logger.info(f"Data saved to {writer.path}")
+                else:
+                    self.logger.warning(f"No data to save to {filename}")
+            except Exception as e:
+                self.failed = True
+                writer.discard()
+                self.logger.error(f"Failed to save data to {filename}: {str(e)}")
+        return None if self.failed else paths
+
+
+# Formats that are already compressed and are stored in archives as-is
+STORED_EXTENSIONS = frozenset([".jpg", ".jpeg", ".png", ".gif", ".webp", ".gz", ".zst", ".zip"])
+
+# Pre-compressed members are appended through zipfile internals (fp, NameToInfo,
+# start_dir, _didModify, sizeFileHeader) as found in CPython 3.8 to 3.14; on any
+# other version members are written with ZipFile.open() and compressed by zipfile
+ZIP_RAW_MEMBERS = (
+    sys.implementation.name == "cpython" and (3, 8) <= sys.version_info[:2] <= (3, 14)
+    and hasattr(zipfile, "sizeFileHeader")
+)
+
+
+class ZipArchiver:
+    """
+    Compressed, parallel and incremental ZIP archiving of a directory
+
+    Text artifacts are compressed with deflate (or zstd where zipfile supports
+    it), already-compressed files are stored. Members are compressed in a
+    thread pool and written as pre-compressed data (where ZIP_RAW_MEMBERS
+    allows it, otherwise the pool only reads them and zipfile compresses); at
+    most 2x workers members are held in memory at a time. An existing archive is
+    updated in place when files were only added; when files changed or were
+    removed it is rebuilt, copying unchanged members without recompressing.
+    """
+
+    def __init__(self, source_dir, archive_path, compression="deflate", change_detection="mtime", workers=None,
+                 raw_members=ZIP_RAW_MEMBERS):
+        self.source_dir = source_dir
+        self.archive_path = archive_path
+        self.change_detection = change_detection
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.raw_members = raw_members
+        
+        self.compress_type = {"deflate": zipfile.ZIP_DEFLATED, "store": zipfile.ZIP_STORED}.get(compression)
+        if compression == "zstd":
+            # zipfile can only read zstd members from Python 3.14 on
+            if getattr(zipfile, "ZIP_ZSTANDARD", None) and zstandard is not None:
+                self.compress_type = zipfile.ZIP_ZSTANDARD
+            else:
+                self.compress_type = zipfile.ZIP_DEFLATED
+        if self.compress_type is None:
+            raise ValueError(f"Unsupported archive compression: {compression}")
+
+    def _source_files(self):
+        """Map of archive name -> path for everything under source_dir"""
+        files = {}
+        archive = os.path.abspath(self.archive_path)
+        for root, _, names in os.walk(self.source_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                if name.endswith(".part") or os.path.abspath(path) == archive:
+                    continue
+                files[os.path.relpath(path, self.source_dir).replace(os.sep, "/")] = path
+        return files
+
+    @staticmethod
+    def _crc32(path):
+        crc = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc
+
+    def _is_unchanged(self, path, info):
+        """Compare a file with its archive member (size, mtime or CRC)"""
+        stat = os.stat(path)
+        if stat.st_size != info.file_size:
+            return False
+        if self.change_detection == "size":
+            return True
+        if self.change_detection == "hash":
+            return self._crc32(path) == info.CRC
+        
+        # ZIP timestamps have two second resolution
+        dt = time.localtime(stat.st_mtime)[:6]
+        return dt[:5] + (dt[5] // 2 * 2,) == info.date_time
+
+    def _compress(self, arcname, path):
+        """Build a ZipInfo and compressed payload for one file"""
+        zinfo = ZipInfo.from_file(path, arcname)
+        with open(path, 'rb') as f:
+            data = f.read()
+        zinfo.file_size = len(data)
+        zinfo.CRC = zlib.crc32(data)
+        
+        payload = data
+        zinfo.compress_type = zipfile.ZIP_STORED
+        if not self.raw_members:
+            # ZipFile.open() compresses the data while writing it
+            if os.path.splitext(arcname)[1].lower() not in STORED_EXTENSIONS:
+                zinfo.compress_type = self.compress_type
+            return zinfo, payload
+        
+        if os.path.splitext(arcname)[1].lower() not in STORED_EXTENSIONS:
+            if self.compress_type == zipfile.ZIP_DEFLATED:
+                compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+                compressed = compressor.compress(data) + compressor.flush()
+            elif self.compress_type != zipfile.ZIP_STORED:
+                compressed = zstandard.ZstdCompressor().compress(data)
+            else:
+                compressed = data
+            if len(compressed) < len(data):
+                payload = compressed
+                zinfo.compress_type = self.compress_type
+        
+        zinfo.compress_size = len(payload)
+        return zinfo, payload
+
+    @staticmethod
+    def _read_raw(zipf, info):
+        """Compressed bytes of an existing member"""
+        zipf.fp.seek(info.header_offset)
+        header = zipf.fp.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        zipf.fp.seek(name_length + extra_length, os.SEEK_CUR)
+        return zipf.fp.read(info.compress_size)
+
+    @staticmethod
+    def _write_raw(zipf, zinfo, payload):
+        """Append a member whose payload is already compressed"""
+        zinfo.flag_bits &= ~0x08  # sizes and CRC are known, no data descriptor
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader())
+        zipf.fp.write(payload)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+        zipf._didModify = True
+
+    def _write_member(self, zipf, zinfo, payload):
+        """Append a member built by _compress"""
+        if self.raw_members:
+            self._write_raw(zipf, zinfo, payload)
+            return
+        with zipf.open(zinfo, 'w') as f:
+            f.write(payload)
+
+    def _copy_member(self, old_zip, zipf, info):
+        """Copy an unchanged member from the previous archive"""
+        if self.raw_members:
+            self._write_raw(zipf, info, self._read_raw(old_zip, info))
+            return
+        zinfo = ZipInfo(info.filename, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.external_attr = info.external_attr
+        zinfo.file_size = info.file_size
+        with zipf.open(zinfo, 'w') as f:
+            f.write(old_zip.read(info))
+
+    def _compress_all(self, pool, files, names):
+        """Yield (zinfo, payload) in order, keeping a bounded window of members in flight"""
+        window = deque()
+        names = iter(names)
+        for name in names:
+            window.append(pool.submit(self._compress, name, files[name]))
+            if len(window) >= 2 * self.workers:
+                break
+        while window:
+            zinfo, payload = window.popleft().result()
+            next_name = next(names, None)
+            if next_name is not None:
+                window.append(pool.submit(self._compress, next_name, files[next_name]))
+            yield zinfo, payload
+
+    def build(self):
+        """Create or update the archive, returns member statistics"""
+        files = self._source_files()
+        existing = {}
+        old_zip = None
+        if os.path.exists(self.archive_path):
+            try:
+                old_zip = ZipFile(self.archive_path, 'r')
+                existing = {info.filename: info for info in old_zip.infolist()}
+            except zipfile.BadZipFile:
+                old_zip = None
+        
+        try:
+            unchanged = [name for name, path in files.items()
+                         if name in existing and self._is_unchanged(path, existing[name])]
+            unchanged_set = set(unchanged)
+            pending = [name for name in files if name not in unchanged_set]
+            changed = [name for name in pending if name in existing]
+            removed = [name for name in existing if name not in files]
+            stats = {
+                "added": len(pending) - len(changed),
+                "updated": len(changed),
+                "unchanged": len(unchanged),
+                "removed": len(removed)
+            }
+            
+            if old_zip and not pending and not removed:
+                return stats
+            
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                compressed = self._compress_all(pool, files, pending)
+                
+                if old_zip and not changed and not removed:
+                    # Only new files: append them to the existing archive
+                    old_zip.close()
+                    old_zip = None
+                    with ZipFile(self.archive_path, 'a') as zipf:
+                        for zinfo, payload in compressed:
+                            self._write_member(zipf, zinfo, payload)
+                    return stats
+                
+                tmp_path = self.archive_path + ".part"
+                with ZipFile(tmp_path, 'w') as zipf:
+                    for name in unchanged:
+                        self._copy_member(old_zip, zipf, existing[name])
+                    for zinfo, payload in compressed:
+                        self._write_member(zipf, zinfo, payload)
+        finally:
+            if old_zip:
+                old_zip.close()
+        
+        os.replace(tmp_path, self.archive_path)
+        return stats
+
+
+class ArtifactCache:
+    """
+    Content-addressed store for downloaded files, shared across runs
+
+    Blobs are kept under blobs/<sha256[:2]>/<sha256> with an index mapping each
+    URL to its hash and validators (ETag, Last-Modified) for conditional GETs.
+    Blobs are hard linked (or symlinked, or copied) into the run directory.
+    When the store exceeds max_bytes the least recently used blobs are evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(cache_dir, "blobs"), exist_ok=True)
+        
+        self.index = {"urls": {}, "blobs": {}}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def blob_path(self, digest):
+        return os.path.join(self.cache_dir, "blobs", digest[:2], digest)
+
+    def temp_file(self):
+        """Open a temp file inside the cache so it can be renamed into a blob"""
+        fd, path = tempfile.mkstemp(suffix=".part", dir=self.cache_dir)
+        return os.fdopen(fd, 'wb'), path
+
+    def lookup(self, url):
+        """Index entry of a URL whose blob is still present, or None"""
+        with self._lock:
+            entry = self.index["urls"].get(url)
+        if entry and os.path.exists(self.blob_path(entry["hash"])):
+            return entry
+        return None
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a cached URL"""
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, tmp_path, digest, headers):
+        """Move a downloaded temp file into the store and index its URL"""
+        blob = self.blob_path(digest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        if os.path.exists(blob):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, blob)
+        
+        with self._lock:
+            self.index["urls"][url] = {
+                "hash": digest,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified")
+            }
+            self.index["blobs"][digest] = {"size": os.path.getsize(blob), "last_used": time.time()}
+            self.stats["misses"] += 1
+
+    def hit(self, digest):
+        """Record a conditional GET answered with 304"""
+        with self._lock:
+            blob = self.index["blobs"].setdefault(digest, {"size": os.path.getsize(self.blob_path(digest))})
+            blob["last_used"] = time.time()
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += blob["size"]
+
+    def link(self, digest, dest):
+        """Place a blob at dest (hard link, symlink or copy)"""
+        blob = self.blob_path(digest)
+        if os.path.exists(dest) and os.path.samefile(blob, dest):
+            return
+        tmp_dest = f"{dest}.{threading.get_ident()}.link"
+        try:
+            os.link(blob, tmp_dest)
+        except OSError:
+            try:
+                os.symlink(os.path.abspath(blob), tmp_dest)
+            except OSError:
+                shutil.copyfile(blob, tmp_dest)
+        os.replace(tmp_dest, dest)
+
+    def evict(self):
+        """Drop least recently used blobs until the store fits max_bytes"""
+        with self._lock:
+            blobs = self.index["blobs"]
+            total = sum(blob["size"] for blob in blobs.values())
+            for digest in sorted(blobs, key=lambda d: blobs[d].get("last_used", 0)):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(self.blob_path(digest))
+                except FileNotFoundError:
+                    pass
+                total -= blobs.pop(digest)["size"]
+                self.stats["evicted"] += 1
+            
+            self.index["urls"] = {url: entry for url, entry in self.index["urls"].items()
+                                  if entry["hash"] in blobs}
+
+    def save(self):
+        """Evict over-budget blobs and write the index"""
+        self.evict()
+        tmp_path = self.index_path + ".part"
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+
+class ActivityIndex:
+    """
+    Link -> post record index shared by the posts, comments and reactions stages
+
+    Each post's link and text are kept once under a post_id derived from the
+    link (stable across runs); activity rows reference the post by that ID.
+    """
+
+    def __init__(self, rows=()):
+        self.posts = {}
+        self.links = {}
+        self.hits = 0
+        self.dirty = False
+        for row in rows:
+            self.posts[row["link"]] = {"post_id": row["post_id"], "link": row["link"], "text": row["text"]}
+            self.links[row["post_id"]] = row["link"]
+
+    def add(self, link, text):
+        """Register a post, returns its post_id"""
+        record = self.posts.get(link)
+        if record is None:
+            post_id = hashlib.sha256(link.encode('utf-8')).hexdigest()[:12]
+            record = self.posts[link] = {"post_id": post_id, "link": link, "text": text or ""}
+            self.links[post_id] = link
+            self.dirty = True
+        else:
+            self.hits += 1
+            if text and not record["text"]:
+                record["text"] = text
+                self.dirty = True
+        return record["post_id"]
+
+    def link_of(self, post_id):
+        return self.links.get(post_id)
+
+    def rows(self):
+        return list(self.posts.values())
+
+
+class MediaDownloader:
+    """
+    Pooled, bounded-concurrency downloader that streams files to disk
+
+    All requests share one requests.Session. At most `workers` downloads run
+    at once and at most `per_host` of them against the same host. Bodies are
+    written in chunks to a .part file that is renamed when complete; per-file
+    bytes and timings are kept in results.
+    
+    With an ArtifactCache, known URLs are requested conditionally and files are
+    linked from the cache. A "{hash}" placeholder in a target path is replaced
+    with the SHA-256 of the content. When offline, only cached URLs are served.
+    """
+
+    def __init__(self, workers=4, per_host=2, timeout=10, chunk_size=64 * 1024, cache=None):
+        self.workers = workers
+        self.cache = cache
+        self.per_host = per_host
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.results = []
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self._session = None
+        self.offline = False
+
+    @property
+    def session(self):
+        """Shared session, created on first use"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def download(self, url, path):
+        """Stream one URL to path, returns a result dict"""
+        result = {"url": url, "path": path, "status": None, "bytes": 0, "seconds": 0.0,
+                  "sha256": None, "cached": False, "error": None}
+        tmp_path = None
+        started = time.perf_counter()
+        try:
+            if self.offline:
+                # No request at all, only files already in the cache are placed
+                entry = self.cache.lookup(url) if self.cache else None
+                if not entry:
+                    raise RuntimeError("Not in the download cache (offline)")
+                result["sha256"] = entry["hash"]
+                result["cached"] = True
+                self.cache.hit(result["sha256"])
+            else:
+                headers = self.cache.conditional_headers(url) if self.cache else {}
+                with self._host_slot(url):
+                    with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                        result["status"] = response.status_code
+                        if response.status_code == 304 and headers:
+                            result["sha256"] = self.cache.lookup(url)["hash"]
+                            result["cached"] = True
+                            self.cache.hit(result["sha256"])
+                        elif response.status_code == 200:
+                            if self.cache:
+                                f, tmp_path = self.cache.temp_file()
+                            else:
+                                target_dir = os.path.dirname(path) or "."
+                                fd, tmp_path = tempfile.mkstemp(suffix=".part", dir=target_dir)
+                                f = os.fdopen(fd, 'wb')
+                            digest = hashlib.sha256()
+                            with f:
+                                for chunk in response.iter_content(self.chunk_size):
+                                    f.write(chunk)
+                                    digest.update(chunk)
+                                    result["bytes"] += len(chunk)
+                            result["sha256"] = digest.hexdigest()
+                            if self.cache:
+                                self.cache.store(url, tmp_path, result["sha256"], response.headers)
+                                tmp_path = None
+                        else:
+                            result["error"] = f"Status code: {response.status_code}"
+            
+            if result["sha256"]:
+                result["path"] = path = path.replace("{hash}", result["sha256"][:16])
+                if tmp_path:
+                    os.replace(tmp_path, path)
+                    tmp_path = None
+                else:
+                    self.cache.link(result["sha256"], path)
+        except Exception as e:
+            result["error"] = str(e)
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        with self._lock:
+            self.results.append(result)
+        return result
+
+    def download_many(self, jobs):
+        """Download (url, path) pairs concurrently, results keep the job order"""
+        jobs = list(jobs)
+        if len(jobs) <= 1 or self.workers <= 1:
+            return [self.download(url, path) for url, path in jobs]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(lambda job: self.download(*job), jobs))
+
+    @property
+    def stats(self):
+        ok = [r for r in self.results if r["error"] is None]
+        return {
+            "files": len(ok),
+            "failed": len(self.results) - len(ok),
+            "bytes": sum(r["bytes"] for r in ok),
+            "seconds": round(sum(r["seconds"] for r in self.results), 3),
+            "slowest": max((r["seconds"] for r in self.results), default=0.0),
+            "cached": sum(1 for r in ok if r["cached"])
+        }
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.cache:
+            self.cache.save()
+
+
+def process_image(path, thumb_dir, thumb_size=(200, 200), webp_quality=None):
+    """
+    Verify, hash and thumbnail one image (runs in a worker process)
+
+    Returns a result dict with the image size, SHA-256, 64 bit difference hash,
+    thumbnail path, WebP path (when re-encoded) and the CPU time spent.
+    """
+    started = time.process_time()
+    result = {"path": path, "ok": False, "error": None, "thumbnail": None, "webp": None}
+    try:
+        from PIL import Image
+        
+        with open(path, 'rb') as f:
+            data = f.read()
+        result["sha256"] = hashlib.sha256(data).hexdigest()
+        
+        # verify() leaves the image unusable, decode from a fresh handle afterwards
+        with Image.open(io.BytesIO(data)) as img:
+            img.verify()
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+            result["format"] = img.format
+            result["width"], result["height"] = img.size
+            img = img.convert("RGB")
+            
+            # Difference hash: compare neighbouring pixels of a 9x8 grayscale image
+            pixels = list(img.convert("L").resize((9, 8), Image.LANCZOS).getdata())
+            bits = 0
+            for row in range(8):
+                for col in range(8):
+                    bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+            result["dhash"] = f"{bits:016x}"
+            
+            name = os.path.splitext(os.path.basename(path))[0]
+            thumb = img.copy()
+            thumb.thumbnail(thumb_size)
+            result["thumbnail"] = os.path.join(thumb_dir, f"{name}.jpg")
+            thumb.save(result["thumbnail"], "JPEG", quality=85)
+            
+            if webp_quality is not None:
+                result["webp"] = os.path.splitext(path)[0] + ".webp"
+                img.save(result["webp"], "WEBP", quality=webp_quality)
+        
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = str(e)
+    
+    result["cpu_time"] = round(time.process_time() - started, 4)
+    return result
+
+
+def make_contact_sheet(thumbnails, sheet_path, thumb_size=(200, 200), columns=6):
+    """Tile thumbnails into a single JPEG (runs in a worker process)"""
+    from PIL import Image
+    
+    rows = (len(thumbnails) + columns - 1) // columns
+    sheet = Image.new("RGB", (thumb_size[0] * min(columns, len(thumbnails)), thumb_size[1] * rows), "white")
+    for i, thumb_path in enumerate(thumbnails):
+        with Image.open(thumb_path) as thumb:
+            x = (i % columns) * thumb_size[0] + (thumb_size[0] - thumb.width) // 2
+            y = (i // columns) * thumb_size[1] + (thumb_size[1] - thumb.height) // 2
+            sheet.paste(thumb, (x, y))
+    sheet.save(sheet_path, "JPEG", quality=85)
+    return sheet_path
+
+
+class ImagePostProcessor:
+    """
+    Post-processing of downloaded images in a process pool
+
+    Images are submitted as soon as they are on disk and processed while the
+    browser moves on; finish() waits for the results, removes exact and
+    near-duplicate images (difference hash within dedupe_distance bits) and
+    builds a contact sheet from the remaining thumbnails.
+    
+    Flat images (solid colors, blank placeholders) hash to all zeros or all
+    ones whatever they show, so for them only an identical SHA-256 counts.
+    
+    WebP copies are written next to the originals. With replace_originals,
+    an original is removed once its WebP exists, but only while the cache
+    still holds its bytes and never for images submitted with keep_original.
+    """
+
+    # Difference hashes of images without horizontal gradients
+    DEGENERATE_HASHES = frozenset([0, (1 << 64) - 1])
+
+    def __init__(self, output_dir, workers=None, thumb_size=(200, 200), webp_quality=None, dedupe_distance=5,
+                 replace_originals=False, cache=None):
+        self.output_dir = output_dir
+        self.thumb_dir = os.path.join(output_dir, "thumbnails")
+        self.workers = workers
+        self.thumb_size = thumb_size
+        self.webp_quality = webp_quality
+        self.dedupe_distance = dedupe_distance
+        self.replace_originals = replace_originals
+        self.cache = cache
+        self.results = []
+        self.duplicates = []
+        self.contact_sheet = None
+        self._pool = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def submit(self, path, dedupe=True, keep_original=False):
+        """Queue one image, returns immediately"""
+        with self._lock:
+            if self._pool is None:
+                os.makedirs(self.thumb_dir, exist_ok=True)
+                # Submitted from pipeline threads: fork would copy a multi-threaded process
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            future = self._pool.submit(process_image, path, self.thumb_dir, self.thumb_size, self.webp_quality)
+            self._pending.append((future, dedupe, keep_original))
+
+    def _is_duplicate(self, result, other):
+        """Same bytes, or difference hashes within dedupe_distance bits (unless one is degenerate)"""
+        if result["sha256"] == other["sha256"]:
+            return True
+        bits, other_bits = int(result["dhash"], 16), int(other["dhash"], 16)
+        if bits in self.DEGENERATE_HASHES or other_bits in self.DEGENERATE_HASHES:
+            return False
+        return bin(bits ^ other_bits).count("1") <= self.dedupe_distance
+
+    def _dedupe(self, results):
+        """Delete images that repeat an earlier one exactly or perceptually"""
+        kept = []
+        for result in sorted(results, key=lambda r: r["path"]):
+            original = next((k for k in kept if self._is_duplicate(result, k)), None)
+            if original is None:
+                kept.append(result)
+                continue
+            
+            result["duplicate_of"] = os.path.basename(original["path"])
+            self.duplicates.append(result)
+            for path in (result["path"], result["thumbnail"], result["webp"]):
+                if path and os.path.exists(path):
+                    os.remove(path)
+
+    def _replace_originals(self, results):
+        """Remove originals that have a WebP copy and can be restored from the cache"""
+        for result in results:
+            if not result["webp"] or "duplicate_of" in result or not os.path.exists(result["path"]):
+                continue
+            if self.cache and os.path.exists(self.cache.blob_path(result["sha256"])):
+                os.remove(result["path"])
+                result["replaced"] = True
+
+    def finish(self):
+        """Collect results, dedupe and build the contact sheet"""
+        if self._pool is None:
+            return self.results
+        
+        try:
+            dedupe = []
+            replaceable = []
+            for future, should_dedupe, keep_original in self._pending:
+                result = future.result()
+                self.results.append(result)
+                if result["ok"] and should_dedupe:
+                    dedupe.append(result)
+                if result["ok"] and not keep_original:
+                    replaceable.append(result)
+            self._pending = []
+            
+            self._dedupe(dedupe)
+            
+            if self.replace_originals:
+                self._replace_originals(replaceable)
+            
+            thumbnails = [r["thumbnail"] for r in self.results
+                          if r["ok"] and "duplicate_of" not in r]
+            if thumbnails:
+                sheet_path = os.path.join(self.output_dir, "contact_sheet.jpg")
+                self.contact_sheet = self._pool.submit(
+                    make_contact_sheet, thumbnails, sheet_path, self.thumb_size
+                ).result()
+        finally:
+            self._pool.shutdown()
+            self._pool = None
+        
+        return self.results
+
+    @property
+    def stats(self):
+        return {
+            "images": len(self.results),
+            "invalid": sum(1 for r in self.results if not r["ok"]),
+            "duplicates_removed": len(self.duplicates),
+            "cpu_time": round(sum(r["cpu_time"] for r in self.results), 4),
+            "contact_sheet": self.contact_sheet,
+            "per_image": [
+                {"file": os.path.basename(r["path"]), "cpu_time": r["cpu_time"],
+                 "error": r["error"], "duplicate_of": r.get("duplicate_of")}
+                for r in self.results
+            ]
+        }
+
+
+class PipelineScheduler:
+    """
+    Background executor for scrape_all work that does not need the browser
+
+    Tasks run on a shared thread pool; tasks on the same lane run one at a
+    time in submission order (e.g. the batches of one dataset). join() waits
+    for everything and reports each task to on_done(stage, result, ok), where
+    a task succeeded if it raised nothing and returned something other than
+    None.
+    """
+
+    def __init__(self, workers=4, on_done=None):
+        self.workers = workers
+        self.on_done = on_done
+        self.tasks = []
+        self._pool = None
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    def _executor(self, lane):
+        with self._lock:
+            if lane is not None:
+                if lane not in self._lanes:
+                    self._lanes[lane] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"pipeline-{lane}")
+                return self._lanes[lane]
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline")
+            return self._pool
+
+    def submit(self, stage, name, func, *args, lane=None):
+        """Queue func(*args) on behalf of a stage"""
+        task = {"stage": stage, "name": name, "queued_at": time.perf_counter(),
+                "wait": None, "seconds": None, "error": None}
+        
+        def run():
+            started = time.perf_counter()
+            task["wait"] = round(started - task["queued_at"], 3)
+            _log_context.stage = stage
+            try:
+                return func(*args)
+            finally:
+                _log_context.stage = None
+                task["seconds"] = round(time.perf_counter() - started, 3)
+        
+        task["future"] = self._executor(lane).submit(run)
+        with self._lock:
+            self.tasks.append(task)
+
+    def has_pending(self, stage):
+        """True while a stage has tasks that were not joined yet"""
+        with self._lock:
+            return any("future" in task for task in self.tasks if task["stage"] == stage)
+
+    def join(self, cancel=False):
+        """Wait for (or cancel) all queued tasks and report their outcomes"""
+        with self._lock:
+            executors = list(self._lanes.values()) + ([self._pool] if self._pool else [])
+            self._lanes = {}
+            self._pool = None
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=cancel)
+        
+        with self._lock:
+            joined = [task for task in self.tasks if "future" in task]
+        for task in joined:
+            future = task.pop("future")
+            result = None
+            if future.cancelled():
+                task["error"] = "cancelled"
+            elif future.exception() is not None:
+                task["error"] = str(future.exception())
+            else:
+                result = future.result()
+            
+            ok = task["error"] is None and result is not None
+            if self.on_done:
+                self.on_done(task, result, ok)
+        return self.stats
+
+    @property
+    def stats(self):
+        done = [task for task in self.tasks if "future" not in task]
+        return {
+            "tasks": len(done),
+            "failed": sum(1 for task in done if task["error"]),
+            "busy_time": round(sum(task["seconds"] or 0 for task in done), 3),
+            "max_queue_wait": max((task["wait"] or 0 for task in done), default=0)
+        }
+
+
+# Stages that work on files already on disk and never need the browser
+OFFLINE_STAGES = frozenset(["image_processing"])
+
+# Files updated by every stage, not attributed to a single stage's outputs
+CHECKPOINT_SHARED_FILES = frozenset(["checkpoint.json", "selector_stats.json"])
+
+# Shared as well, by prefix: the log files with their rotated backups (scraper.log.1, ...)
+# and the SQLite store with its temporary -journal, -wal and -shm files
+CHECKPOINT_SHARED_PREFIXES = ("scraper.log", "scraper.jsonl", "linkedin_data.db")
+
+# Datasets counted in total_data_points: the activity and connection lists, as
+# before the writers existed (activity_posts and the interests are not counted)
+DATA_POINT_DATASETS = frozenset([
+    "posts", "comments", "reactions", "connections", "followers", "following"
+])
+
+
+class CheckpointManifest:
+    """
+    Per-stage completion record of a scrape_all run, kept in data_dir
+
+    Each completed stage stores its output files with their SHA-256, the
+    dataset row counts it wrote and its (scalar) result. A stage counts as
+    complete only while all of its outputs are still present and unchanged.
+    A file belongs to the last stage that wrote it. Stages with background
+    work stay "pending" until that work is attached.
+    """
+
+    def __init__(self, data_dir, profile_url, resume=False):
+        self.data_dir = data_dir
+        self.path = os.path.join(data_dir, "checkpoint.json")
+        self.profile_url = profile_url
+        self.data = {"profile_url": profile_url, "stages": {}}
+        
+        if resume and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("profile_url") == profile_url:
+                    self.data = data
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def is_shared(name):
+        """True for files every stage updates, which belong to no stage"""
+        return name in CHECKPOINT_SHARED_FILES or name.startswith(CHECKPOINT_SHARED_PREFIXES)
+
+    @staticmethod
+    def _sha256(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def snapshot(self):
+        """Map of relative path -> (size, mtime) of the stage-owned files in data_dir"""
+        files = {}
+        for root, _, names in os.walk(self.data_dir):
+            for name in names:
+                if self.is_shared(name) or name.endswith(".part"):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                files[os.path.relpath(path, self.data_dir).replace(os.sep, "/")] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def is_complete(self, name):
+        """True when the stage finished and its outputs are intact"""
+        entry = self.data["stages"].get(name)
+        if not entry or entry.get("status") != "done":
+            return False
+        for rel_path, digest in entry["outputs"].items():
+            path = os.path.join(self.data_dir, rel_path)
+            if not os.path.exists(path) or self._sha256(path) != digest:
+                return False
+        return True
+
+    def entry(self, name):
+        return self.data["stages"].get(name, {})
+
+    def record(self, name, before, status, result=None, datasets=None):
+        """Store a stage outcome, outputs are the files changed since `before`"""
+        after = self.snapshot()
+        changed = [rel for rel, stat in after.items() if before.get(rel) != stat]
+        removed = [rel for rel in before if rel not in after]
+        
+        # Re-written or deleted files no longer belong to earlier stages
+        for other in self.data["stages"].values():
+            for rel in changed + removed:
+                other["outputs"].pop(rel, None)
+        
+        self.data["stages"][name] = {
+            "status": status,
+            "finished_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "outputs": {rel: self._sha256(os.path.join(self.data_dir, rel)) for rel in changed},
+            "result": result if isinstance(result, (bool, int, float, str)) else None,
+            "datasets": datasets or {}
+        }
+        self.save()
+
+    def attach(self, name, paths, ok):
+        """Add the outputs of a stage's background task, settling a pending stage"""
+        entry = self.data["stages"].get(name)
+        if not entry:
+            return
+        
+        rel_paths = [os.path.relpath(path, self.data_dir).replace(os.sep, "/") for path in paths
+                     if not self.is_shared(os.path.basename(path)) and os.path.exists(path)]
+        for other in self.data["stages"].values():
+            for rel in rel_paths:
+                other["outputs"].pop(rel, None)
+        for rel in rel_paths:
+            entry["outputs"][rel] = self._sha256(os.path.join(self.data_dir, rel))
+        
+        if not ok:
+            entry["status"] = "failed"
+        elif entry["status"] == "pending":
+            entry["status"] = "done"
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + ".part"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class SnapshotArchive:
+    """
+    Gzip-compressed DOM snapshots of the pages a run visited, for record/replay
+
+    Each page is stored once per (url, variant) after scrolling, as
+    <sha1>.html.gz, and listed in manifest.json together with the outcome of
+    every navigation and the login result. A replay serves the same pages to
+    the extraction stages without a browser.
+    """
+
+    def __init__(self, snapshot_dir, profile_url, replay=False):
+        self.snapshot_dir = snapshot_dir
+        self.manifest_path = os.path.join(snapshot_dir, "manifest.json")
+        self.data = {
+            "profile_url": profile_url,
+            "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "logged_in": None,
+            "navigations": {},
+            "pages": {}
+        }
+        
+        if replay:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+            if self.data.get("profile_url") != profile_url:
+                raise ValueError(f"Snapshots in {snapshot_dir} were recorded for {self.data.get('profile_url')}")
+        else:
+            os.makedirs(snapshot_dir, exist_ok=True)
+
+    @staticmethod
+    def key(url, variant=None):
+        return f"{url}#{variant}" if variant else url
+
+    def save(self, url, html, variant=None):
+        """Compress and store the DOM of a page, replacing an earlier recording"""
+        key = self.key(url, variant)
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".html.gz"
+        path = os.path.join(self.snapshot_dir, file_name)
+        payload = html.encode("utf-8")
+        
+        tmp_path = path + ".part"
+        with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        
+        self.data["pages"][key] = {
+            "url": url,
+            "variant": variant,
+            "file": file_name,
+            "bytes": len(payload),
+            "compressed_bytes": os.path.getsize(path),
+            "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        self.save_manifest()
+
+    def load(self, url, variant=None):
+        """Recorded DOM of a page, or None"""
+        page = self.data["pages"].get(self.key(url, variant))
+        if not page:
+            return None
+        with gzip.open(os.path.join(self.snapshot_dir, page["file"]), 'rb') as f:
+            return f.read().decode("utf-8")
+
+    def note_navigation(self, url, outcome):
+        self.data["navigations"][url] = outcome
+
+    def navigation(self, url):
+        """Recorded navigation outcome of a URL ("timeout" if it was never visited)"""
+        return self.data["navigations"].get(url, "timeout")
+
+    @property
+    def stats(self):
+        pages = self.data["pages"].values()
+        return {
+            "pages": len(pages),
+            "bytes": sum(page["bytes"] for page in pages),
+            "compressed_bytes": sum(page["compressed_bytes"] for page in pages)
+        }
+
+    def save_manifest(self):
+        tmp_path = self.manifest_path + ".part"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+# Stage of the background task running on the current thread, for log records
+_log_context = threading.local()
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Adds stage, stage_elapsed and elapsed (seconds since start) to a scraper's log records
+
+    Only a weak reference to the scraper is kept, reading its current_stage
+    and lookup_budget, so the logger never keeps the scraper alive.
+    """
+
+    def __init__(self, scraper):
+        super().__init__()
+        self._scraper = weakref.ref(scraper)
+        self.started = time.time()
+
+    def filter(self, record):
+        scraper = self._scraper()
+        budget = scraper.lookup_budget if scraper else None
+        current_stage = scraper.current_stage if scraper else None
+        record.stage = getattr(_log_context, "stage", None) or current_stage
+        record.stage_elapsed = None
+        if budget and budget.stage == record.stage:
+            record.stage_elapsed = round(time.perf_counter() - budget.started, 3)
+        record.elapsed = round(record.created - self.started, 3)
+        return True
+
+
+class RepeatedWarningFilter(logging.Filter):
+    """
+    Drops per-item warnings after `limit` of them per kind
+
+    Only records logged with extra={"repeat_key": ...} (the warnings in the
+    per-row extraction and download loops) are limited, counted per key.
+    Dropped records are only counted; drain() returns the counts per key.
+    """
+
+    def __init__(self, limit=5):
+        super().__init__()
+        self.limit = limit
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = getattr(record, "repeat_key", None)
+        if not self.limit or key is None:
+            return True
+        with self._lock:
+            count = self.counts[key] = self.counts.get(key, 0) + 1
+        return count <= self.limit
+
+    def drain(self):
+        """{repeat_key: suppressed count} since the last drain"""
+        with self._lock:
+            suppressed = {key: count - self.limit for key, count in self.counts.items() if count > self.limit}
+            self.counts = {}
+        return suppressed
+
+
+class StructuredQueueHandler(QueueHandler):
+    """QueueHandler that formats tracebacks before enqueueing and keeps them separate from the message"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class JSONLogFormatter(logging.Formatter):
+    """One JSON object per line with the fields added by LogContextFilter"""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "stage": getattr(record, "stage", None),
+            "stage_elapsed": getattr(record, "stage_elapsed", None),
+            "elapsed": getattr(record, "elapsed", None),
+            "thread": record.threadName
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class LinkedInScraperPro:
+    def __init__(self, profile_url, email=None, password=None, headless=False, max_scrolls=15,
+                 extraction_mode="snapshot", stage_wait_budget=60, scroll_mode="observer",
+                 page_ready_timeout=15, pdf_backend="cdp", block_resources=True,
+                 incremental_extraction=False, json_format="json", storage="files",
+                 json_backend="auto", json_pretty=True, json_compression=None,
+                 archive_path=None, archive_compression="deflate", archive_change_detection="mtime",
+                 media_workers=4, media_per_host=2,
+                 cache_dir="linkedin_cache", cache_max_mb=512,
+                 image_processing=False, image_workers=None, webp_quality=None, image_dedupe_distance=5,
+                 webp_replace_originals=False,
+                 resume=False, refresh=False, refresh_stop_after=5, dedupe_activities=False,
+                 pipeline=True, pipeline_workers=4,
+                 resource_sampling=True, sample_interval=1.0, profile_stage=None, profiler="cprofile",
+                 record=False, replay=False, snapshot_dir="linkedin_snapshots", driver_path=None,
+                 log_format="text", log_max_mb=10, log_backups=3, log_warning_limit=5):
+        """
+        Initialize LinkedIn Creeps Scraper
+        
+        Parameters:
+            profile_url (str): LinkedIn profile URL
+            email (str, optional): Email for login
+            password (str, optional): Password for login
+            headless (bool): Run browser in headless mode
+            max_scrolls (int): Maximum scroll attempts to load content
+            extraction_mode (str): "snapshot" parses one HTML snapshot per list with lxml,
+                "webdriver" queries every item through the browser
+            stage_wait_budget (float, optional): Maximum seconds each stage may block
+                waiting for top-level elements (None for no limit)
+            scroll_mode (str): "observer" waits on DOM growth via a MutationObserver,
+                "sleep" uses fixed pauses between scrolls
+            page_ready_timeout (float): Maximum seconds to wait for a page to become
+                ready after navigation
+            pdf_backend (str): "cdp" prints the loaded tab with Chrome DevTools,
+                "pdfkit" renders the page snapshot with wkhtmltopdf
+            block_resources (bool): Block images, media, fonts and trackers in
+                stages that do not need them and report bytes per stage
+            incremental_extraction (bool): Extract newly loaded list items after every
+                scroll step instead of once at the end (needs snapshot extraction)
+            json_format (str): "json" writes a JSON array per dataset, "ndjson" one
+                object per line (.ndjson)
+            storage (str): "files" writes CSV/JSON per dataset, "sqlite" stores every
+                dataset in linkedin_data.db (export with export_datasets)
+            json_backend (str): "auto" (orjson when installed), "orjson" or "stdlib"
+            json_pretty (bool): Indent JSON output, compact when False
+            json_compression (str, optional): None, "gzip" or "zstd"
+            archive_path (str, optional): ZIP archive location (default
+                linkedin_data_archive.zip next to the data directory)
+            archive_compression (str): "deflate", "zstd" (Python 3.14+) or "store"
+            archive_change_detection (str): How unchanged files are recognized when
+                updating an existing archive: "mtime", "size" or "hash"
+            media_workers (int): Concurrent image downloads
+            media_per_host (int): Concurrent downloads allowed against one host
+            cache_dir (str, optional): Content-addressed download cache shared across
+                runs (None disables it)
+            cache_max_mb (int): Cache size limit, least recently used files are evicted
+            image_processing (bool): Verify downloaded images, create thumbnails and a
+                contact sheet and remove duplicates in a process pool
+            image_workers (int, optional): Image processing processes (default CPU count)
+            webp_quality (int, optional): Re-encode images to WebP with this quality
+            image_dedupe_distance (int): Max differing perceptual hash bits for two
+                images to count as duplicates
+            webp_replace_originals (bool): Remove media originals once their WebP copy
+                exists (only while the download cache holds them; never the
+                profile picture)
+            resume (bool): Skip stages that completed in a previous run of the same
+                profile (see checkpoint.json); browser and login start only when a
+                stage still has to run
+            refresh (bool): Delta refresh of activities: stop scrolling once
+                previously stored links show up and merge new items into the existing
+                outputs with first_seen/last_seen stamps
+            refresh_stop_after (int): Consecutive known links that end scrolling
+            dedupe_activities (bool): Store each post's link and text once in
+                activity_posts; posts/comments/reactions rows reference it by post_id
+            pipeline (bool): Run browser-independent work (dataset writers, downloads,
+                offline PDF rendering) in background threads while the browser moves on
+            pipeline_workers (int): Background threads shared by that work
+            resource_sampling (bool): Sample RSS/CPU of Python and the browser per
+                stage (needs psutil)
+            sample_interval (float): Seconds between resource samples
+            profile_stage (str, optional): Stage to run under a profiler, the report
+                is saved as data_dir/profile_<stage>.prof (or .html)
+            profiler (str): "cprofile" or "pyinstrument"
+            record (bool): Save the final DOM of every visited page (after
+                scrolling) as compressed snapshots in snapshot_dir
+            replay (bool): Run all extraction and output stages against recorded
+                snapshots, without a browser or network (needs lxml)
+            snapshot_dir (str): Location of the recorded snapshots and manifest.json
+            driver_path (str, optional): chromedriver binary to use (CHROMEDRIVER_PATH
+                also works); otherwise the path pinned by an earlier run is reused
+                without a network version check
+            log_format (str): "text" writes scraper.log, "json" writes scraper.jsonl
+                with one object per record (stage and timing fields included)
+            log_max_mb (float): Size at which the log file is rotated
+            log_backups (int): Rotated log files to keep
+            log_warning_limit (int): Per-item warnings (failed rows, downloads, images)
+                logged per kind and stage before the rest are only counted (0 for no limit)
+        """
+        # Invalid configurations fail before the log writer, cache or store exist
+        if record and replay:
+            raise ValueError("record and replay cannot be combined")
+        self.profile_url = self._validate_url(profile_url)
+        self.snapshots = None
+        if record or replay:
+            self.snapshots = SnapshotArchive(snapshot_dir, self.profile_url, replay)
+        self.email = email
+        self.password = password
+        self.headless = headless
+        self.max_scrolls = max_scrolls
+        self.data_dir = "linkedin_data"
+        self.driver = None
+        self.wait_time = random.uniform(2, 5)
+        self.max_retries = 3
+        self.stage_wait_budget = stage_wait_budget
+        self.scroll_mode = scroll_mode
+        self.page_ready_timeout = page_ready_timeout
+        self.pdf_backend = pdf_backend
+        self.block_resources = block_resources
+        self.resource_monitor = None
+        self.json_format = json_format
+        self.serializer = JSONSerializer(json_backend, json_pretty, json_compression)
+        self.archive_path = archive_path or os.path.join(
+            os.path.dirname(os.path.abspath(self.data_dir)), "linkedin_data_archive.zip"
+        )
+        self.archive_compression = archive_compression
+        self.archive_change_detection = archive_change_detection
+        cache = ArtifactCache(cache_dir, cache_max_mb * 1024 * 1024) if cache_dir else None
+        self.downloader = MediaDownloader(media_workers, media_per_host, cache=cache)
+        self.driver_path = driver_path
+        self.driver_pin_path = os.path.join(
+            cache_dir or os.path.dirname(os.path.abspath(self.data_dir)), "chromedriver.json"
+        )
+        self.startup_stats = {"import_seconds": IMPORT_SECONDS}
+        self.image_processor = None
+        if image_processing:
+            self.image_processor = ImagePostProcessor(
+                self.data_dir, image_workers, webp_quality=webp_quality, dedupe_distance=image_dedupe_distance,
+                replace_originals=webp_replace_originals, cache=cache
+            )
+        self.datasets = {}
+        self.navigations = []
+        self.page_cache = {}
+        self.current_page = None
+        self.lookup_budget = None
+        self.stage_stats = {}
+        self.current_stage = None
+        self.command_counter = None
+        self.resource_sampling = resource_sampling
+        self.sample_interval = sample_interval
+        self.resource_sampler = None
+        self.profile_stage = profile_stage
+        self.profiler = profiler
+        self.pipeline = PipelineScheduler(pipeline_workers, self._pipeline_task_done) if pipeline else None
+        self.resume = resume
+        self.resumed_counts = {}
+        self.login_success = None
+        self.record = record
+        self.replay = replay
+        
+        # Create data directory (the log file lives in it)
+        os.makedirs(self.data_dir, exist_ok=True)
+        
+        self.log_format = log_format
+        self.log_max_bytes = int(log_max_mb * 1024 * 1024)
+        self.log_backups = log_backups
+        self.warning_filter = RepeatedWarningFilter(log_warning_limit)
+        self._log_listener = None
+        self._logging_open = False
+        self.logger = self._setup_logging()
+        self.selectors = SelectorRegistry(stats_path=os.path.join(self.data_dir, "selector_stats.json"))
+        
+        # Snapshot extraction needs lxml, fall back to live lookups without it
+        self.snapshot_extractor = None
+        if extraction_mode == "snapshot":
+            try:
+                self.snapshot_extractor = SnapshotExtractor(self.selectors)
+            except ImportError as e:
+                self.logger.warning(f"{str(e)}, falling back to WebDriver extraction")
+                extraction_mode = "webdriver"
+        self.extraction_mode = extraction_mode
+        
+        if replay:
+            # Recorded pages are parsed in-process, there is no browser to fall back on
+            if not self.snapshot_extractor:
+                self.snapshot_extractor = SnapshotExtractor(self.selectors)
+                self.extraction_mode = "snapshot"
+            self.downloader.offline = True
+        
+        self.incremental_extraction = incremental_extraction
+        if incremental_extraction and not self.snapshot_extractor:
+            self.logger.warning("Incremental extraction needs snapshot extraction, disabled")
+            self.incremental_extraction = False
+        
+        # Early stop on known links happens while scrolling, i.e. in incremental extraction
+        self.refresh = refresh
+        self.refresh_stop_after = refresh_stop_after
+        self.dedupe_activities = dedupe_activities
+        self.activity_index = None
+        if refresh and not self.incremental_extraction:
+            if self.snapshot_extractor:
+                self.incremental_extraction = True
+            else:
+                self.logger.warning("Refresh without snapshot extraction scrolls the full history")
+        
+        self.store = None
+        if storage == "sqlite":
+            self.store = SQLiteResultStore(os.path.join(self.data_dir, "linkedin_data.db"))
+        
+        self.checkpoint = CheckpointManifest(self.data_dir, self.profile_url, resume)
+
+    def _setup_logging(self):
+        """
+        Configure a logger for this instance
+        
+        Callers only put records on a queue; a QueueListener thread formats them
+        and writes the rotating log file and the console. Each instance has its
+        own logger and handlers, nothing is configured on the root logger. The
+        logger is not registered with logging.getLogger(), so it is released
+        together with the instance and never shared with a later one.
+        """
+        logger = logging.Logger(f"{__name__}.{id(self):x}", logging.INFO)
+        logger.propagate = False
+        
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(StructuredQueueHandler(log_queue))
+        logger.addFilter(LogContextFilter(self))
+        logger.addFilter(self.warning_filter)
+        
+        text_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        if self.log_format == "json":
+            file_handler = RotatingFileHandler(
+                os.path.join(self.data_dir, 'scraper.jsonl'), maxBytes=self.log_max_bytes,
+                backupCount=self.log_backups, encoding='utf-8'
+            )
+            file_handler.setFormatter(JSONLogFormatter())
+        else:
+            file_handler = RotatingFileHandler(
+                os.path.join(self.data_dir, 'scraper.log'), maxBytes=self.log_max_bytes,
+                backupCount=self.log_backups, encoding='utf-8'
+            )
+            file_handler.setFormatter(text_formatter)
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(text_formatter)
+        
+        self._log_listener = QueueListener(log_queue, file_handler, console_handler)
+        self.open_logging()
+        return logger
+
+    def open_logging(self):
+        """Start the log writer thread (again after close_logging)"""
+        if not self._logging_open:
+            self._log_listener.start()
+            self._logging_open = True
+
+    def close_logging(self):
+        """Write out queued log records, stop the writer thread and close the log file"""
+        if self._logging_open:
+            self._logging_open = False
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+
+    def report_suppressed_warnings(self):
+        """Log how many repeated per-item warnings were dropped"""
+        for key, count in self.warning_filter.drain().items():
+            self.logger.info(f"Suppressed {count} repeated '{key}' warnings")
+
+    def _validate_url(self, url):
+        """Validate and normalize LinkedIn profile URL"""
+        if not url:
+            raise ValueError("Profile URL cannot be empty")
+        
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+            
+        parsed = urlparse(url)
+        if 'linkedin.com' not in parsed.netloc:
+            raise ValueError("URL must be a valid LinkedIn profile")
+            
+        return url.rstrip('/')
+
+    def start_driver(self):
+        """Initialize WebDriver with optimal configuration"""
+        try:
+            self.startup_stats["selenium_import_seconds"] = load_selenium()
+            options = webdriver.ChromeOptions()
+            
+            # Return from get() at DOMContentLoaded, readiness is checked per page
+            options.page_load_strategy = 'eager'
+            
+            # Basic configuration
+            options.add_argument("--disable-blink-features=AutomationControlled")
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option('useAutomationExtension', False)
+            
+            # Stability settings
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-plugins")
+            
+            # Natural user agent
+            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            
+            # Network events for per-stage byte accounting
+            if self.block_resources:
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+                options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+            
+            if self.headless:
+                options.add_argument("--headless=new")
+            else:
+                options.add_argument("--start-maximized")
+            
+            started = time.perf_counter()
+            driver_path, source = self.resolve_driver_path()
+            resolved = time.perf_counter()
+            try:
+                service = Service(driver_path)
+                self.driver = webdriver.Chrome(service=service, options=options)
+            except WebDriverException as e:
+                if source != "pinned":
+                    raise
+                # Chrome was updated past the pinned driver, resolve it again once
+                self.logger.warning(f"Pinned chromedriver failed to start, resolving again: {str(e)}")
+                resolved = time.perf_counter()
+                driver_path, source = self._install_driver(), "webdriver_manager"
+                service = Service(driver_path)
+                self.driver = webdriver.Chrome(service=service, options=options)
+            launched = time.perf_counter()
+            
+            self.startup_stats.update({
+                "driver_path": driver_path,
+                "driver_source": source,
+                "driver_resolve_seconds": round(resolved - started, 3),
+                "driver_launch_seconds": round(launched - resolved, 3)
+            })
+            
+            # No implicit wait: scoped lookups miss immediately, readiness waits are explicit
+            self.driver.implicitly_wait(0)
+            
+            self.command_counter = WebDriverCommandCounter(self.driver)
+            if self.resource_sampling:
+                try:
+                    self.resource_sampler = ResourceSampler(service.process.pid, self.sample_interval)
+                    self.resource_sampler.start()
+                except Exception as e:
+                    self.logger.warning(f"Resource sampling unavailable: {str(e)}")
+            
+            # Hide webdriver
+            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            if self.block_resources:
+                try:
+                    self.resource_monitor = ResourceMonitor(self.driver)
+                except Exception as e:
+                    self.logger.warning(f"Resource blocking unavailable: {str(e)}")
+            
+            stats = self.startup_stats
+            self.logger.info(
+                f"WebDriver initialized successfully (imports {stats['import_seconds'] + stats['selenium_import_seconds']:.2f}s, "
+                f"driver lookup {stats['driver_resolve_seconds']:.2f}s via {source}, "
+                f"browser launch {stats['driver_launch_seconds']:.2f}s)"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
+            raise
+
+    def resolve_driver_path(self):
+        """
+        chromedriver binary to launch, returns (path, source)
+        
+        An explicit driver_path or CHROMEDRIVER_PATH is used as is. Otherwise the
+        path pinned by an earlier run is reused; webdriver_manager (which checks
+        versions over the network) only runs when nothing usable is pinned.
+        """
+        explicit = self.driver_path or os.environ.get("CHROMEDRIVER_PATH")
+        if explicit:
+            return explicit, "explicit"
+        
+        try:
+            with open(self.driver_pin_path, 'r', encoding='utf-8') as f:
+                pinned = json.load(f).get("path")
+            if pinned and os.access(pinned, os.X_OK):
+                return pinned, "pinned"
+        except (OSError, ValueError):
+            pass
+        
+        return self._install_driver(), "webdriver_manager"
+
+    def _install_driver(self):
+        """Resolve chromedriver with webdriver_manager and pin the result"""
+        from webdriver_manager.chrome import ChromeDriverManager
+        
+        driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(self.driver_pin_path) or ".", exist_ok=True)
+            with open(self.driver_pin_path, 'w', encoding='utf-8') as f:
+                json.dump({"path": driver_path, "pinned_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Failed to pin chromedriver path: {str(e)}")
+        return driver_path
+
+    def linkedin_login(self):
+        """Login to LinkedIn with improved error handling"""
+        if not self.email or not self.password:
+            self.logger.info("No login credentials provided")
+            return False
+        
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.info(f"Attempting LinkedIn login (attempt {attempt + 1})")
+                self.driver.get("https://www.linkedin.com/login")
+                
+                # Wait for page to load
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.ID, "username"))
+                )
+                
+                # Input credentials
+                email_field = self.driver.find_element(By.ID, "username")
+                email_field.clear()
+                email_field.send_keys(self.email)
+                
+                password_field = self.driver.find_element(By.ID, "password")
+                password_field.clear()
+                password_field.send_keys(self.password)
+                
+                # Click login button
+                login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+                login_button.click()
+                
+                # Wait for successful login or CAPTCHA
+                try:
+                    WebDriverWait(self.driver, 20).until(
+                        lambda driver: "/feed/" in driver.current_url or "/challenge/" in driver.current_url
+                    )
+                    
+                    if "/challenge/" in self.driver.current_url:
+                        self.logger.warning("CAPTCHA or additional verification required. Please complete manually.")
+                        input("Press Enter after completing verification...")
+                    
+                    # Verify login success
+                    WebDriverWait(self.driver, 15).until(
+                        EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Search' or @placeholder='Cari']"))
+                    )
+                    
+                    self.logger.info("Login successful!")
+                    self.pause(random.uniform(2, 4))
+                    return True
+                    
+                except TimeoutException:
+                    self.logger.warning("Login may have failed or requires additional verification")
+                    continue
+                    
+            except Exception as e:
+                self.logger.error(f"Login failed (attempt {attempt + 1}): {str(e)}")
+                if attempt == self.max_retries - 1:
+                    return False
+                self.pause(random.uniform(3, 6))
+        
+        return False
+
+    def safe_find_elements(self, by, value, timeout=15, parent=None, warn=True):
+        """
+        Find elements with error handling
+        
+        Lookups scoped to an already loaded parent return immediately. Top-level
+        lookups block up to timeout, capped by the remaining stage wait budget.
+        """
+        if parent is not None:
+            try:
+                return parent.find_elements(by, value)
+            except Exception as e:
+                self.logger.error(f"Error while finding elements: {str(e)}")
+                return []
+        
+        if self.lookup_budget and self.lookup_budget.remaining() is not None:
+            timeout = min(timeout, self.lookup_budget.remaining())
+        
+        started = time.perf_counter()
+        found = []
+        try:
+            found = WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_all_elements_located((by, value))
+            )
+            return found
+        except TimeoutException:
+            if warn:
+                self.logger.warning(f"Elements not found: {value}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error while finding elements: {str(e)}")
+            return []
+        finally:
+            if self.lookup_budget:
+                self.lookup_budget.record(time.perf_counter() - started, bool(found))
+
+    def find_field(self, field, timeout=15, parent=None):
+        """
+        Find elements for a selector registry field, best selector first
+        
+        Only the first selector may block waiting for the page; fallbacks are
+        checked immediately.
+        """
+        for index, xpath in enumerate(self.selectors.candidates(field)):
+            started = time.perf_counter()
+            found = self.safe_find_elements(
+                By.XPATH, xpath, timeout=timeout if index == 0 else 0, parent=parent, warn=False
+            )
+            self.selectors.record(field, xpath, bool(found), time.perf_counter() - started)
+            if found:
+                return found
+        
+        if parent is None:
+            self.logger.warning(f"Elements not found: {field}")
+        return []
+
+    def begin_stage(self, name):
+        """Start a scraping stage with a fresh lookup wait budget and resource profile"""
+        self.lookup_budget = LookupBudget(name, self.stage_wait_budget)
+        if self.command_counter:
+            self.command_counter.stage = name
+        if self.resource_sampler:
+            self.resource_sampler.stage = name
+        
+        if self.resource_monitor:
+            try:
+                # Traffic so far belongs to the previous step, not this stage
+                self.resource_monitor.collect()
+                self.resource_monitor.apply(STAGE_RESOURCE_PROFILES.get(name, "full"))
+            except Exception as e:
+                self.logger.warning(f"Failed to apply resource profile: {str(e)}")
+
+    def end_stage(self):
+        """Finish the current stage and log how long it waited on lookups"""
+        if not self.lookup_budget:
+            return None
+        
+        stats = self.lookup_budget.report()
+        self.stage_stats[stats["stage"]] = stats
+        self.lookup_budget = None
+        
+        if self.command_counter:
+            stats["webdriver"] = self.command_counter.report(stats["stage"])
+            self.command_counter.stage = None
+        if self.resource_sampler:
+            try:
+                self.resource_sampler.sample()
+            except Exception:
+                pass
+            stats["resources"] = self.resource_sampler.report(stats["stage"])
+            self.resource_sampler.stage = None
+        self.report_suppressed_warnings()
+        self.logger.info(
+            f"Stage '{stats['stage']}' done in {stats['wall_time']:.1f}s, "
+            f"waited {stats['wait_time']:.1f}s on {stats['lookups']} lookups "
+            f"({stats['misses']} misses, {stats['miss_wait_time']:.1f}s), slept {stats['sleep_time']:.1f}s"
+            + (f", {stats['webdriver']['commands']} WebDriver commands ({stats['webdriver']['command_time']:.1f}s)"
+               if "webdriver" in stats else "")
+        )
+        
+        if self.resource_monitor:
+            try:
+                network = self.resource_monitor.collect()
+                stats["network"] = network
+                self.logger.info(
+                    f"Stage '{stats['stage']}' transferred {network['bytes_transferred'] / 1024:.0f} KB, "
+                    f"blocked {sum(network['blocked_requests'].values())} requests "
+                    f"(~{network['bytes_saved_estimate'] / 1024:.0f} KB saved, profile '{network['profile']}')"
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to collect network statistics: {str(e)}")
+        
+        return stats
+
+    def ensure_session(self):
+        """Start the browser and log in on first use, returns the login result"""
+        if self.replay:
+            return self.snapshots.data.get("logged_in") or False
+        
+        if self.driver is None:
+            self.start_driver()
+            
+            # Login if credentials provided
+            self.login_success = False
+            if self.email and self.password:
+                self.login_success = self.linkedin_login()
+            
+            if self.record:
+                self.snapshots.data["logged_in"] = self.login_success
+                self.snapshots.save_manifest()
+        return self.login_success
+
+    def stage_done(self, name):
+        """True when resuming and the stage completed in an earlier run"""
+        return self.resume and self.checkpoint.is_complete(name)
+
+    def run_stage(self, name, func, *args, **kwargs):
+        """Run one scrape_all step as a named stage, checkpointing its outcome"""
+        if self.stage_done(name):
+            entry = self.checkpoint.entry(name)
+            self.resumed_counts.update(entry["datasets"])
+            self.stage_stats[name] = {"stage": name, "resumed": True}
+            self.logger.info(f"Stage '{name}' already completed, skipping")
+            return entry["result"]
+        
+        if name not in OFFLINE_STAGES:
+            self.ensure_session()
+        
+        before = self.checkpoint.snapshot()
+        opened = dict(self.datasets)
+        status = "failed"
+        result = None
+        self.current_stage = name
+        self.begin_stage(name)
+        try:
+            if name == self.profile_stage:
+                result = self._profile_call(name, func, *args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+            # Scrapers return None/False/{} when they failed; [] and 0 are real empty results.
+            # A dataset whose files could not be written fails the stage as well.
+            written = [dataset for key, dataset in self.datasets.items() if opened.get(key) is not dataset]
+            write_failed = any(dataset.failed for dataset in written)
+            if result is not None and result is not False and result != {} and not write_failed:
+                status = "pending" if self.pipeline and self.pipeline.has_pending(name) else "done"
+            return result
+        finally:
+            self.end_stage()
+            self.current_stage = None
+            datasets = {key: dataset.count for key, dataset in self.datasets.items() if key not in opened}
+            try:
+                self.checkpoint.record(name, before, status, result, datasets)
+            except Exception as e:
+                self.logger.warning(f"Failed to write checkpoint: {str(e)}")
+
+    def _profile_call(self, name, func, *args, **kwargs):
+        """Run one stage under cProfile or pyinstrument, the report goes to data_dir"""
+        if self.profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                self.logger.warning("pyinstrument is not installed, profiling with cProfile")
+            else:
+                profiler = Profiler()
+                profiler.start()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profiler.stop()
+                    report_path = os.path.join(self.data_dir, f"profile_{name}.html")
+                    with open(report_path, 'w', encoding='utf-8') as f:
+                        f.write(profiler.output_html())
+                    self.logger.info(f"Stage profile saved: {report_path}")
+        
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            report_path = os.path.join(self.data_dir, f"profile_{name}.prof")
+            profiler.dump_stats(report_path)
+            self.logger.info(f"Stage profile saved: {report_path} (open with pstats or snakeviz)")
+
+    def pause(self, seconds):
+        """time.sleep accounted to the current stage"""
+        time.sleep(seconds)
+        if self.lookup_budget:
+            self.lookup_budget.sleep_time += seconds
+
+    def defer(self, name, func, *args, lane=None):
+        """
+        Run browser-independent work in the background pipeline
+        
+        func returns the paths it wrote (None on failure); they are attached to
+        the current stage's checkpoint when the pipeline is joined. Without a
+        pipeline func runs inline and its result is returned.
+        """
+        if not self.pipeline:
+            return func(*args)
+        self.pipeline.submit(self.current_stage, name, func, *args, lane=lane)
+        return True
+
+    def _pipeline_task_done(self, task, paths, ok):
+        """Record the outcome of a background task"""
+        if task["error"]:
+            self.logger.error(f"Background task '{task['name']}' failed: {task['error']}")
+        if task["stage"]:
+            try:
+                self.checkpoint.attach(task["stage"], paths or [], ok)
+            except Exception as e:
+                self.logger.warning(f"Failed to write checkpoint: {str(e)}")
+
+    def join_pipeline(self):
+        """Wait for all background work before results are summarized"""
+        stats = self.pipeline.join()
+        self.logger.info(
+            f"Background pipeline finished {stats['tasks']} tasks "
+            f"({stats['failed']} failed, {stats['busy_time']:.1f}s busy)"
+        )
+
+    def navigate(self, url, ready_field, timeout=None):
+        """
+        Load a page and wait until it is ready to scrape
+        
+        Waits for any selector of ready_field (or a redirect to the login wall),
+        capped at timeout seconds. Returns "ready", "redirected" or "timeout".
+        """
+        if self.replay:
+            outcome = self.snapshots.navigation(url)
+            self.current_page = url
+            self.navigations.append({"url": url, "ready_field": ready_field, "outcome": outcome, "replayed": True})
+            return outcome
+        
+        timeout = timeout or self.page_ready_timeout
+        ready_xpath = self.selectors.union(ready_field)
+        
+        def page_ready(driver):
+            current_url = driver.current_url
+            if is_login_wall(current_url):
+                return "redirected"
+            return "ready" if driver.find_elements(By.XPATH, ready_xpath) else False
+        
+        started = time.perf_counter()
+        self.driver.get(url)
+        loaded = time.perf_counter()
+        try:
+            outcome = WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(page_ready)
+        except TimeoutException:
+            outcome = "timeout"
+        finished = time.perf_counter()
+        
+        if self.lookup_budget:
+            self.lookup_budget.record(finished - loaded, outcome == "ready")
+        
+        self.current_page = url
+        if self.record:
+            self.snapshots.note_navigation(url, outcome)
+        self.navigations.append({
+            "url": url,
+            "ready_field": ready_field,
+            "outcome": outcome,
+            "load_time": round(loaded - started, 3),
+            "wait_time": round(finished - loaded, 3)
+        })
+        self.logger.info(
+            f"Navigated to {url}: {outcome} (load {loaded - started:.1f}s, wait {finished - loaded:.1f}s)"
+        )
+        return outcome
+
+    def load_page(self, url, ready_field, live=False):
+        """
+        Load a page once per run and return its PageSnapshot
+        
+        Later calls for the same URL reuse the snapshot. With live=True the
+        browser is navigated back to the page if it has since moved on.
+        """
+        snapshot = self.page_cache.get(url)
+        if snapshot is None or (live and self.current_page != url):
+            outcome = self.navigate(url, ready_field)
+            if self.replay:
+                snapshot = PageSnapshot(url, self.replay_page(url), outcome)
+            else:
+                snapshot = PageSnapshot(url, self.driver.page_source, outcome)
+                if self.record:
+                    self.record_page(url, html=snapshot.html)
+            self.page_cache[url] = snapshot
+        return snapshot
+
+    def record_page(self, url, variant=None, html=None):
+        """In record mode, save the current DOM of a page"""
+        if not self.record:
+            return
+        try:
+            self.snapshots.save(url, html if html is not None else self.driver.page_source, variant)
+        except Exception as e:
+            self.logger.warning(f"Failed to record {self.snapshots.key(url, variant)}: {str(e)}")
+
+    def replay_page(self, url, variant=None):
+        """Recorded DOM of a page in replay mode, or None"""
+        html = self.snapshots.load(url, variant)
+        if html is None:
+            self.logger.warning(f"No recorded snapshot of {self.snapshots.key(url, variant)}")
+        return html
+
+    def safe_get_text(self, element):
+        """Get element text with error handling"""
+        try:
+            return element.text.strip()
+        except Exception:
+            return ""
+
+    def safe_get_attribute(self, element, attribute):
+        """Get element attribute with error handling"""
+        try:
+            return element.get_attribute(attribute)
+        except Exception:
+            return ""
+
+    def scroll_page(self, scroll_pause_time=1, max_scrolls=None):
+        """Scroll page to load more content"""
+        state = None
+        for state in self.scroll_steps(scroll_pause_time, max_scrolls):
+            pass
+        return state
+
+    def scroll_steps(self, scroll_pause_time=1, max_scrolls=None):
+        """Scroll page to load more content, yielding the page state after every scroll"""
+        max_scrolls = max_scrolls or self.max_scrolls
+        self.logger.info(f"Scrolling page (max {max_scrolls} times)...")
+        
+        if self.scroll_mode == "observer":
+            yield from self._observer_scroll_steps(scroll_pause_time, max_scrolls)
+            return
+        
+        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        scrolls = 0
+        no_change_count = 0
+        
+        while scrolls < max_scrolls and no_change_count < 3:
+            # Scroll to bottom
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            self.pause(scroll_pause_time)
+            
+            # Calculate new height
+            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            
+            if new_height == last_height:
+                no_change_count += 1
+                # Try clicking "See more" button if available
+                try:
+                    see_more_buttons = self.safe_find_elements(
+                        By.XPATH, 
+                        "//button[contains(@aria-label, 'Lihat selengkapnya') or contains(@aria-label, 'See more')]",
+                        timeout=2
+                    )
+                    if see_more_buttons:
+                        see_more_buttons[0].click()
+                        self.pause(2)
+                except:
+                    pass
+            else:
+                no_change_count = 0
+                
+            last_height = new_height
+            scrolls += 1
+            
+            # Random delay to avoid bot detection
+            self.pause(random.uniform(0.5, 2))
+            
+            yield {"reason": "quiet" if no_change_count else "grew", "items": None, "height": new_height}
+
+    def _scroll_and_extract(self, container_field, item_field, parse_item, key_index, max_scrolls=None,
+                            known=None, stop_after=None):
+        """
+        Scroll a list page and yield (no, *fields) for new items after every step
+        
+        Unseen items are pulled as outerHTML strings, parsed in-process and
+        deduplicated by fields[key_index]; no WebElement references are held.
+        If scrolling fails, the items extracted so far are kept. With known
+        keys, scrolling stops after stop_after consecutive known items.
+        """
+        container_xpaths = self.selectors.candidates(container_field) if container_field else []
+        item_xpath = self.selectors.union(item_field)
+        seen = set()
+        count = 0
+        known_run = 0
+        
+        try:
+            for _ in self.scroll_steps(max_scrolls=max_scrolls):
+                fragments = self.driver.execute_script(COLLECT_NEW_ITEMS_SCRIPT, container_xpaths, item_xpath)
+                for fragment in fragments or []:
+                    count += 1
+                    try:
+                        fields = parse_item(self.snapshot_extractor.parse(fragment))
+                    except Exception as e:
+                        self.logger.warning(f"Failed to process item {count}: {str(e)}", extra={"repeat_key": "item"})
+                        continue
+                    if not fields or fields[key_index] in seen:
+                        continue
+                    seen.add(fields[key_index])
+                    yield (count,) + fields
+                    
+                    if known is not None:
+                        known_run = known_run + 1 if fields[key_index] in known else 0
+                if known and stop_after and known_run >= stop_after:
+                    self.logger.info(f"Reached {known_run} already known items, stopped scrolling")
+                    return
+        except Exception as e:
+            self.logger.error(f"Scrolling stopped early, keeping {len(seen)} items: {str(e)}")
+
+    def _collect_activities(self, activity_url, activity_type, known=None):
+        """Scroll the activity list and yield (no, link, text, comment) per item"""
+        # Text is None for links whose text is already stored
+        skip_text = set(known or ())
+        if self.activity_index:
+            skip_text.update(self.activity_index.posts)
+        
+        if self.replay:
+            html = self.replay_page(activity_url, activity_type)
+            if html is not None:
+                yield from self.snapshot_extractor.extract_activities(
+                    html, activity_url, activity_type, skip_text, container_field="activity_container"
+                )
+            return
+        
+        if self.incremental_extraction:
+            yield from self._scroll_and_extract(
+                "activity_container", "activity_item",
+                lambda post: self.snapshot_extractor.activity_fields(post, activity_url, activity_type, skip_text),
+                key_index=0, known=known, stop_after=self.refresh_stop_after
+            )
+            self.record_page(activity_url, activity_type)
+            return
+        
+        # Scroll to load content
+        self.scroll_page()
+        
+        # Find all activities
+        activities_container = self.find_field("activity_container", timeout=15)
+        
+        if not activities_container:
+            self.logger.warning("Activities container not found")
+            return
+        
+        if self.snapshot_extractor:
+            # One round trip for the whole list, parsed in-process
+            html = self.driver.execute_script("return arguments[0].outerHTML;", activities_container[0])
+            yield from self.snapshot_extractor.extract_activities(html, activity_url, activity_type, skip_text)
+        else:
+            yield from self._extract_activities_live(activities_container[0], activity_type, skip_text)
+        self.record_page(activity_url, activity_type)
+
+    def _collect_entities(self, page_url, label, max_scrolls=None):
+        """Scroll an entity list and yield (no, name, url, subtitle) per card"""
+        if self.replay:
+            html = self.replay_page(page_url)
+            if html is not None:
+                yield from self.snapshot_extractor.extract_entities(html, page_url)
+            return
+        
+        if self.incremental_extraction:
+            yield from self._scroll_and_extract(
+                None, "entity_item",
+                lambda item: self.snapshot_extractor.entity_fields(item, page_url),
+                key_index=1, max_scrolls=max_scrolls
+            )
+        else:
+            # Scroll to load content
+            self.scroll_page(max_scrolls=max_scrolls)
+            
+            yield from self._extract_entities(page_url, label)
+        self.record_page(page_url)
+
+    def load_dataset_rows(self, name):
+        """Rows stored by an earlier run (SQLite store or the dataset's CSV file)"""
+        if self.store:
+            return self.store.rows(self.profile_url, name)
+        
+        csv_path = os.path.join(self.data_dir, f"{name}.csv")
+        if not os.path.exists(csv_path):
+            return []
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def _align_stored_activities(self, rows):
+        """
+        Convert stored activity rows to the layout of this run
+        
+        Rows written with dedupe_activities carry a post_id into activity_posts,
+        rows written without it carry link and text. Rows in the other layout
+        are converted, so their links are known to the refresh.
+        """
+        if self.activity_index is not None:
+            for row in rows:
+                if row.get("link"):
+                    row["post_id"] = self.activity_index.add(row["link"], row.get("text"))
+            return rows
+        
+        if any(row.get("post_id") for row in rows):
+            posts = ActivityIndex(self.load_dataset_rows("activity_posts"))
+            for row in rows:
+                if row.get("post_id") and not row.get("link"):
+                    row["link"] = posts.link_of(row["post_id"])
+                    row["text"] = posts.posts.get(row["link"], {}).get("text", "")
+        return rows
+
+    def _merge_refresh(self, new_rows, existing_rows, revisited):
+        """
+        Merge a delta refresh: new rows first, then the stored ones
+        
+        Rows get first_seen/last_seen; stored rows seen again in this run get
+        a new last_seen. Rows are renumbered in the merged order.
+        """
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        for row in new_rows:
+            row["first_seen"] = row["last_seen"] = now
+        for row in existing_rows:
+            row["first_seen"] = row.get("first_seen") or row.get("scraped_at")
+            row["last_seen"] = now if self._activity_link(row) in revisited else (row.get("last_seen") or row.get("scraped_at"))
+        
+        merged = new_rows + existing_rows
+        for no, row in enumerate(merged, 1):
+            row["no"] = no
+        return merged
+
+    def _activity_row(self, no, link, text_content, comment_text, activity_type):
+        """Build an activity row"""
+        text_content = text_content or ""
+        text_content = text_content[:500] + "..." if len(text_content) > 500 else text_content
+        
+        if self.activity_index is not None:
+            # Link and text live in activity_posts, the row references them
+            return {
+                "no": no,
+                "post_id": self.activity_index.add(link, text_content),
+                "comment": comment_text,
+                "type": activity_type,
+                "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+        
+        return {
+            "no": no,
+            "link": link,
+            "text": text_content,
+            "comment": comment_text,
+            "type": activity_type,
+            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    def _activity_link(self, row):
+        """Link of a stored activity row, also for rows that reference activity_posts"""
+        if row.get("link"):
+            return row["link"]
+        return self.activity_index.link_of(row.get("post_id")) if self.activity_index else None
+
+    def save_activity_index(self):
+        """Rewrite activity_posts with every post known to the index"""
+        dataset = self.open_dataset("activity_posts")
+        try:
+            for row in self.activity_index.rows():
+                dataset.append(row)
+        finally:
+            dataset.close()
+        self.activity_index.dirty = False
+
+    def _extract_activities_live(self, container, activity_type, skip_text=None):
+        """Yield (no, link, text, comment) for every activity item via WebDriver lookups"""
+        posts = self.find_field("activity_item", parent=container)
+        
+        for i, post in enumerate(posts, 1):
+            try:
+                # Get link
+                link_element = self.find_field("activity_link", parent=post)
+                
+                if not link_element:
+                    continue
+                    
+                link = self.safe_get_attribute(link_element[0], "href").split('?')[0]
+                
+                # Get text (unless it is already stored)
+                text_content = None
+                if not skip_text or link not in skip_text:
+                    text_content = ""
+                    text_element = self.find_field("activity_text", parent=post)
+                    
+                    if text_element:
+                        text_content = self.safe_get_text(text_element[0])
+                
+                # For comments, get comment text
+                comment_text = ""
+                if activity_type == "comments":
+                    comment_element = self.find_field("comment_text", parent=post)
+                    if comment_element:
+                        comment_text = self.safe_get_text(comment_element[0])
+                
+                yield i, link, text_content, comment_text
+                
+            except Exception as e:
+                self.logger.warning(f"Failed to process {activity_type} {i}: {str(e)}", extra={"repeat_key": "item"})
+                continue
+
+    def _extract_entities(self, page_url, label):
+        """Yield (no, name, url, subtitle) for every entity card on the current page"""
+        if self.snapshot_extractor:
+            # One round trip for the whole page, parsed in-process
+            yield from self.snapshot_extractor.extract_entities(self.driver.page_source, page_url)
+            return
+        
+        items = self.find_field("entity_item", timeout=15)
+        
+        for i, item in enumerate(items, 1):
+            try:
+                # Get name and URL
+                name_element = self.find_field("entity_name", parent=item)
+                
+                if not name_element:
+                    continue
+                    
+                name = self.safe_get_text(name_element[0])
+                url = self.safe_get_attribute(name_element[0], "href").split('?')[0]
+                
+                # Get headline/description if available
+                subtitle = ""
+                subtitle_element = self.find_field("entity_subtitle", parent=item)
+                if subtitle_element:
+                    subtitle = self.safe_get_text(subtitle_element[0])
+                
+                yield i, name, url, subtitle
+                
+            except Exception as e:
+                self.logger.warning(f"Failed to process {label} {i}: {str(e)}", extra={"repeat_key": "item"})
+                continue
+
+    def _observer_scroll_steps(self, quiet_period, max_scrolls, step_timeout=10):
+        """
+        Scroll until the list stops growing, one round trip per scroll
+        
+        Each step resolves as soon as new items land in the list container, or
+        after quiet_period seconds without DOM changes (clicking "See more" once
+        before giving up on that step).
+        """
+        self.driver.set_script_timeout(step_timeout + 5)
+        container_xpaths = self.selectors.candidates("list_container")
+        see_more_xpath = self.selectors.union("see_more")
+        
+        state = {"reason": None, "items": 0, "height": 0}
+        last_height = 0
+        scrolls = 0
+        quiet_count = 0
+        
+        while scrolls < max_scrolls and quiet_count < 2:
+            try:
+                state = self.driver.execute_async_script(
+                    SCROLL_OBSERVER_SCRIPT, container_xpaths, see_more_xpath,
+                    int(quiet_period * 1000), int(step_timeout * 1000)
+                )
+            except TimeoutException:
+                self.logger.warning("Scroll step timed out")
+                break
+            
+            # Constant churn (e.g. animations) ends in a timeout; count it by height
+            grew = state["reason"] == "grew" or state["height"] > last_height
+            quiet_count = 0 if grew else quiet_count + 1
+            last_height = state["height"]
+            scrolls += 1
+            yield state
+        
+        self.logger.info(f"Scrolled {scrolls} times: {state['items']} items, height {state['height']}px")
+
+    def save_profile_as_pdf(self):
+        """Save profile as PDF (DevTools, then pdfkit) with HTML fallback"""
+        try:
+            self.logger.info("Saving profile as PDF...")
+            pdf_path = os.path.join(self.data_dir, "profile.pdf")
+            
+            # DevTools prints the live tab, pdfkit only needs the snapshot
+            print_live = self.pdf_backend == "cdp" and not self.replay
+            snapshot = self.load_page(self.profile_url, "profile_name", live=print_live)
+            
+            if print_live:
+                try:
+                    self._print_pdf_cdp(snapshot, pdf_path)
+                    self.logger.info(f"Profile PDF saved: {pdf_path}")
+                    return True
+                except Exception as e:
+                    self.logger.warning(f"PDF backend _print_pdf_cdp failed: {str(e)}")
+            
+            # pdfkit and the HTML fallback only need the snapshot, not the browser
+            return self.defer("profile_pdf", self._save_snapshot_pdf, snapshot, pdf_path) is not None
+        except Exception as e:
+            self.logger.error(f"Failed to save profile: {str(e)}")
+            return False
+
+    def _save_snapshot_pdf(self, snapshot, pdf_path):
+        """Render the snapshot with pdfkit or save it as HTML, returns the written paths"""
+        # wkhtmltopdf fetches the page's remote assets, a replay stays offline
+        if not self.replay:
+            try:
+                self._print_pdf_pdfkit(snapshot, pdf_path)
+                self.logger.info(f"Profile PDF saved: {pdf_path}")
+                return [pdf_path]
+            except Exception as e:
+                self.logger.warning(f"PDF backend _print_pdf_pdfkit failed: {str(e)}")
+        
+        try:
+            # Use HTML as fallback if PDF fails
+            self.logger.warning("Failed to save PDF, switching to HTML")
+            html_path = os.path.join(self.data_dir, "profile.html")
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(snapshot.html)
+            self.logger.info(f"Profile HTML saved: {html_path}")
+            return [html_path]
+        except Exception as e:
+            self.logger.error(f"Failed to save profile: {str(e)}")
+            return None
+
+    def _print_pdf_cdp(self, snapshot, pdf_path, chunk_size=1 << 20):
+        """Print the loaded tab with Page.printToPDF and stream it to disk"""
+        # Pages are returned at DOMContentLoaded, the print needs images and fonts
+        self.driver.set_script_timeout(self.page_ready_timeout + 5)
+        outcome = self.driver.execute_async_script(PRINT_READY_SCRIPT, int(self.page_ready_timeout * 1000))
+        if outcome != "ready":
+            self.logger.warning("Profile page still loading images or fonts, printing anyway")
+        
+        result = self.driver.execute_cdp_cmd("Page.printToPDF", {
+            "printBackground": True,
+            "paperWidth": 8.27,  # A4, inches
+            "paperHeight": 11.69,
+            "marginTop": 0,
+            "marginBottom": 0,
+            "marginLeft": 0,
+            "marginRight": 0,
+            "transferMode": "ReturnAsStream"
+        })
+        
+        tmp_path = pdf_path + ".part"
+        with open(tmp_path, 'wb') as f:
+            stream = result.get("stream")
+            if not stream:
+                f.write(base64.b64decode(result["data"]))
+            else:
+                try:
+                    while True:
+                        chunk = self.driver.execute_cdp_cmd("IO.read", {"handle": stream, "size": chunk_size})
+                        data = chunk.get("data", "")
+                        f.write(base64.b64decode(data) if chunk.get("base64Encoded") else data.encode('utf-8'))
+                        if chunk.get("eof"):
+                            break
+                finally:
+                    self.driver.execute_cdp_cmd("IO.close", {"handle": stream})
+        os.replace(tmp_path, pdf_path)
+
+    def _print_pdf_pdfkit(self, snapshot, pdf_path):
+        """Render the page snapshot with wkhtmltopdf (no session needed)"""
+        try:
+            import pdfkit
+        except ImportError:
+            raise RuntimeError("pdfkit not installed")
+        
+        wkhtmltopdf = shutil.which("wkhtmltopdf") or '/usr/local/bin/wkhtmltopdf'
+        config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf)
+        
+        options = {
+            'quiet': '',
+            'page-size': 'A4',
+            'margin-top': '0mm',
+            'margin-right': '0mm',
+            'margin-bottom': '0mm',
+            'margin-left': '0mm',
+            'encoding': "UTF-8",
+        }
+        
+        html = snapshot.html.replace("<head>", f'<head><base href="{snapshot.url}">', 1)
+        pdfkit.from_string(html, pdf_path, configuration=config, options=options)
+
+    def scrape_basic_profile_info(self):
+        """Scrape basic profile information"""
+        try:
+            self.logger.info("Collecting basic profile info...")
+            
+            if self.snapshot_extractor:
+                snapshot = self.load_page(self.profile_url, "profile_name")
+                profile_info = self.snapshot_extractor.extract_profile(snapshot.html)
+            else:
+                self.load_page(self.profile_url, "profile_name", live=True)
+                profile_info = self._extract_profile_live()
+            
+            # Save data
+            self.save_profile_info(profile_info)
+            self.logger.info(f"Successfully collected profile info: {profile_info['name']}")
+            
+            return profile_info
+            
+        except Exception as e:
+            self.logger.error(f"Failed to collect profile info: {str(e)}")
+            return {}
+
+    def _extract_profile_live(self):
+        """Basic profile fields via WebDriver lookups on the loaded profile page"""
+        profile_info = {}
+        
+        # Name
+        name_element = self.find_field("profile_name")[0]
+        profile_info['name'] = self.safe_get_text(name_element)
+        
+        # Headline/Title
+        headline_element = self.find_field("profile_headline")[0]
+        profile_info['headline'] = self.safe_get_text(headline_element)
+        
+        # Location
+        location_element = self.find_field("profile_location")
+        profile_info['location'] = self.safe_get_text(location_element[0]) if location_element else "Not found"
+        
+        # About section
+        try:
+            show_more = self.find_field("about_show_more")
+            if show_more:
+                show_more[0].click()
+                self.pause(1)
+            
+            about_element = self.find_field("about")
+            profile_info['about'] = self.safe_get_text(about_element[0]) if about_element else "Not found"
+        except:
+            profile_info['about'] = "Not found"
+        
+        return profile_info
+
+    def download_profile_image(self):
+        """Download profile picture"""
+        try:
+            self.logger.info("Downloading profile picture...")
+            
+            # Find profile image
+            if self.snapshot_extractor:
+                snapshot = self.load_page(self.profile_url, "profile_name")
+                img_url = self.snapshot_extractor.extract_image_src(snapshot.html, snapshot.url)
+            else:
+                self.load_page(self.profile_url, "profile_name", live=True)
+                img_element = self.find_field("profile_image", timeout=15)
+                img_url = self.safe_get_attribute(img_element[0], "src") if img_element else None
+            
+            if img_url is None:
+                self.logger.warning("Profile picture not found")
+                return False
+            
+            if not img_url:
+                self.logger.warning("Profile picture URL not found")
+                return False
+            
+            # Download high quality image
+            if '=' in img_url:  # URL with parameters
+                img_url = img_url.split('=')[0] + '=photo-size-800x800'
+            
+            img_path = os.path.join(self.data_dir, "profile_picture.jpg")
+            return self.defer("profile_image", self._download_profile_image_file, img_url, img_path) is not None
+                
+        except Exception as e:
+            self.logger.error(f"Failed to download profile picture: {str(e)}")
+            return False
+
+    def _download_profile_image_file(self, img_url, img_path):
+        """Fetch the profile picture, returns the written paths"""
+        result = self.downloader.download(img_url, img_path)
+        if result["error"] is None:
+            self.logger.info(f"Profile picture downloaded: {img_path} ({result['bytes']} bytes in {result['seconds']}s)")
+            if self.image_processor:
+                self.image_processor.submit(result["path"], dedupe=False, keep_original=True)
+            return [img_path]
+        else:
+            self.logger.warning(f"Failed to download profile picture. {result['error']}")
+            return None
+
+    def scrape_activity(self, activity_type="posts"):
+        """
+        Scrape activities (posts, comments, reactions)
+        
+        Parameters:
+            activity_type (str): posts, comments, reactions
+        """
+        type_names = {
+            "posts": "posts",
+            "comments": "comments",
+            "reactions": "reactions"
+        }
+        
+        self.logger.info(f"Collecting {type_names.get(activity_type, 'activities')}...")
+        activities = []
+        dataset = None
+        
+        if self.dedupe_activities and self.activity_index is None:
+            self.activity_index = ActivityIndex(self.load_dataset_rows("activity_posts"))
+        
+        try:
+            activity_url = f"{self.profile_url}/details/activity/"
+            self.navigate(activity_url, "activity_container")
+            
+            # Select appropriate tab (recorded separately per tab)
+            if activity_type != "posts" and not self.replay:
+                try:
+                    tab_button = self.safe_find_elements(
+                        By.XPATH,
+                        f"//button[contains(@aria-label, '{activity_type.capitalize()}') or contains(@aria-label, '{type_names.get(activity_type, '')}')]",
+                        timeout=15
+                    )[0]
+                    tab_button.click()
+                    self.pause(self.wait_time)
+                except:
+                    self.logger.warning(f"{activity_type} tab not found")
+                    return None
+            
+            if self.refresh:
+                return self._refresh_activities(activity_url, activity_type)
+            
+            # Rows are written as they are extracted
+            dataset = self.open_dataset(activity_type)
+            for i, link, text_content, comment_text in self._collect_activities(activity_url, activity_type):
+                row = self._activity_row(i, link, text_content, comment_text, activity_type)
+                activities.append(row)
+                dataset.append(row)
+            
+            self.logger.info(f"Successfully collected {len(activities)} {type_names.get(activity_type, 'activities')}")
+            return activities
+            
+        except Exception as e:
+            self.logger.error(f"Failed to collect {type_names.get(activity_type, 'activities')}: {str(e)}")
+            return None
+        finally:
+            if dataset:
+                dataset.close()
+            if self.activity_index is not None and self.activity_index.dirty:
+                self.save_activity_index()
+
+    def _refresh_activities(self, activity_url, activity_type):
+        """Collect only activities newer than the stored ones and rewrite the merged dataset"""
+        existing = self._align_stored_activities(self.load_dataset_rows(activity_type))
+        known = {self._activity_link(row) for row in existing}
+        known.discard(None)
+        
+        new_rows = []
+        revisited = set()
+        for i, link, text_content, comment_text in self._collect_activities(activity_url, activity_type, known):
+            if link in known:
+                revisited.add(link)
+                continue
+            new_rows.append(self._activity_row(i, link, text_content, comment_text, activity_type))
+        
+        merged = self._merge_refresh(new_rows, existing, revisited)
+        
+        # The writers take their columns from the first row, every row gets the same ones
+        if self.activity_index is not None:
+            columns = ["no", "post_id", "comment", "type", "scraped_at", "first_seen", "last_seen"]
+        else:
+            columns = ["no", "link", "text", "comment", "type", "scraped_at", "first_seen", "last_seen"]
+        merged = [{column: row.get(column) for column in columns} for row in merged]
+        
+        dataset = self.open_dataset(activity_type)
+        try:
+            for row in merged:
+                dataset.append(row)
+        finally:
+            dataset.close()
+        
+        self.logger.info(f"Refresh found {len(new_rows)} new {activity_type} ({len(merged)} total)")
+        return merged
+
+    def scrape_connections(self, connection_type="connections"):
+        """
+        Scrape connections (connections, followers, following)
+        
+        Parameters:
+            connection_type (str): connections, followers, following
+        """
+        type_names = {
+            "connections": "connections",
+            "followers": "followers", 
+            "following": "following"
+        }
+        
+        self.logger.info(f"Collecting {type_names.get(connection_type, 'connections')}...")
+        connections = []
+        dataset = None
+        
+        try:
+            # Construct URL based on connection type
+            if connection_type == "connections":
+                connections_url = f"{self.profile_url}/details/connections/"
+            else:
+                connections_url = f"{self.profile_url}/details/{connection_type}/"
+            
+            # Check if login is required
+            if self.navigate(connections_url, "list_ready") == "redirected":
+                self.logger.warning(f"Login required to access {type_names.get(connection_type)}")
+                return None
+            
+            # Rows are written as they are extracted
+            dataset = self.open_dataset(connection_type)
+            for i, name, url, headline in self._collect_entities(connections_url, "connection"):
+                row = {
+                    "no": i,
+                    "name": name,
+                    "url": url,
+                    "headline": headline,
+                    "type": connection_type,
+                    "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                }
+                connections.append(row)
+                dataset.append(row)
+            
+            self.logger.info(f"Successfully collected {len(connections)} {type_names.get(connection_type)}")
+            return connections
+            
+        except Exception as e:
+            self.logger.error(f"Failed to collect {type_names.get(connection_type)}: {str(e)}")
+            return None
+        finally:
+            if dataset:
+                dataset.close()
+
+    def scrape_interests(self):
+        """Scrape all interests (Top Voices, Companies, Groups, etc.)"""
+        self.logger.info("Collecting interests...")
+        all_interests = {}
+        
+        interest_types = {
+            "top-voices": "Top Voices",
+            "companies": "Companies",
+            "groups": "Groups",
+            "newsletters": "Newsletters",
+            "schools": "Schools"
+        }
+        
+        failed = []
+        for itype, name in interest_types.items():
+            self.logger.info(f"Collecting interest: {name}...")
+            dataset = None
+            try:
+                page_url = f"{self.profile_url}/details/interests/?detail={itype}"
+                self.navigate(page_url, "list_ready")
+                
+                interests = []
+                dataset = self.open_dataset(itype)
+                for i, item_name, url, description in self._collect_entities(page_url, "interest", max_scrolls=5):
+                    row = {
+                        "no": i,
+                        "name": item_name,
+                        "url": url,
+                        "description": description,
+                        "type": itype,
+                        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                    }
+                    interests.append(row)
+                    dataset.append(row)
+                
+                all_interests[itype] = interests
+                
+            except Exception as e:
+                self.logger.error(f"Failed to collect interest {name}: {str(e)}")
+                failed.append(itype)
+                continue
+            finally:
+                if dataset:
+                    dataset.close()
+        
+        # A partial result would be checkpointed as complete, the stage is retried instead
+        if failed:
+            self.logger.warning(f"Interests incomplete, failed: {', '.join(failed)}")
+            return None
+        return all_interests
+
+    def download_media(self):
+        """Download all uploaded media (images)"""
+        self.logger.info("Downloading uploaded media...")
+        try:
+            media_url = f"{self.profile_url}/details/media/"
+            self.navigate(media_url, "list_ready")
+            
+            if self.replay:
+                html = self.replay_page(media_url)
+                img_urls = self.snapshot_extractor.extract_image_srcs(html, media_url) if html is not None else []
+            else:
+                # Scroll to load content
+                self.scroll_page()
+                
+                # Find all images
+                images = self.find_field("media_image", timeout=15)
+                img_urls = [self.safe_get_attribute(img, "src") for img in images]
+                self.record_page(media_url)
+            
+            media_dir = os.path.join(self.data_dir, "media")
+            os.makedirs(media_dir, exist_ok=True)
+            
+            # Collect URLs first, the downloads run without the browser
+            jobs = []
+            for i, img_url in enumerate(img_urls, 1):
+                try:
+                    if not img_url or not img_url.startswith('http'):
+                        continue
+                        
+                    # Download high quality image if possible
+                    if '=' in img_url:  # URL with parameters
+                        img_url = img_url.split('=')[0] + '=w800-h800'
+                    
+                    # Named by content so the same image keeps its file name across runs
+                    jobs.append((img_url, os.path.join(media_dir, "media_{hash}.jpg")))
+                except Exception as e:
+                    self.logger.warning(f"Failed to read media {i}: {str(e)}", extra={"repeat_key": "media"})
+                    continue
+            
+            # Media is the last browser stage, nothing is left to overlap with, so the
+            # downloads run here and the result is the downloaded count in every mode
+            paths = self._download_media_files(jobs)
+            if jobs and not paths:
+                # 0 means "nothing to download"; a run where every download failed is retried
+                self.logger.error("Failed to download media: no download succeeded")
+                return None
+            return len(paths)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to download media: {str(e)}")
+            return None
+
+    def _download_media_files(self, jobs):
+        """Download (url, path) jobs, returns the paths written"""
+        paths = []
+        for result in self.downloader.download_many(jobs):
+            if result["error"] is None:
+                if result["path"] not in paths:
+                    paths.append(result["path"])
+                    if self.image_processor:
+                        self.image_processor.submit(result["path"])
+            else:
+                self.logger.warning(f"Failed to download media {os.path.basename(result['path'])}: {result['error']}",
+                                    extra={"repeat_key": "media_download"})
+        
+        self.logger.info(f"Successfully downloaded {len(paths)} media items")
+        return paths
+
+    def finish_image_processing(self):
+        """Wait for the image post-processing started by the download stages"""
+        results = self.image_processor.finish()
+        stats = self.image_processor.stats
+        for result in results:
+            if result["error"]:
+                self.logger.warning(f"Invalid image {os.path.basename(result['path'])}: {result['error']}",
+                                    extra={"repeat_key": "invalid_image"})
+        self.logger.info(
+            f"Processed {stats['images']} images ({stats['duplicates_removed']} duplicates removed, "
+            f"{stats['cpu_time']}s CPU)"
+        )
+        return stats['images']
+
+    def open_dataset(self, name):
+        """Open the streaming writers of a dataset (SQLite store or CSV + JSON files)"""
+        defer = self.defer if self.pipeline else None
+        if self.store:
+            dataset = DatasetWriter(name, [SQLiteRowWriter(self.store, self.profile_url, name)], self.logger, defer)
+        else:
+            dataset = self._open_file_dataset(name, defer)
+        self.datasets[name] = dataset
+        return dataset
+
+    def _open_file_dataset(self, name, defer=None):
+        """Open streaming CSV and JSON writers for a dataset"""
+        csv_writer = CSVRowWriter(os.path.join(self.data_dir, f"{name}.csv"))
+        if self.json_format == "ndjson":
+            json_writer = NDJSONRowWriter(os.path.join(self.data_dir, f"{name}.ndjson"), self.serializer)
+        else:
+            json_writer = JSONArrayRowWriter(os.path.join(self.data_dir, f"{name}.json"), self.serializer)
+        
+        return DatasetWriter(name, [csv_writer, json_writer], self.logger, defer)
+
+    def export_datasets(self, names=None):
+        """
+        Export datasets from the SQLite store to CSV/JSON files on demand
+        
+        The files match the ones of storage="files": profile_info.json for the
+        profile, and activity columns a run did not use (refresh, dedupe) are
+        left out.
+        """
+        if not self.store:
+            self.logger.warning("No SQLite store to export from")
+            return []
+        
+        if not names:
+            names = self.store.datasets(self.profile_url)
+            if self.store.profile(self.profile_url):
+                names = ["profile_info"] + names
+        for name in names:
+            if name == "profile_info":
+                self.save_to_json(self.store.profile(self.profile_url), "profile_info.json")
+                continue
+            dataset = self._open_file_dataset(name)
+            for row in self.store.rows(self.profile_url, name, drop_unused=True):
+                dataset.append(row)
+            dataset.close()
+        return names
+
+    def save_profile_info(self, profile_info):
+        """Save basic profile info to the SQLite store or profile_info.json"""
+        if not self.store:
+            self.save_to_json(profile_info, "profile_info.json")
+            return
+        
+        try:
+            self.store.save_profile(self.profile_url, profile_info)
+            self.logger.info(f"Profile info saved to {self.store.path}")
+        except Exception as e:
+            self.logger.error(f"Failed to save profile info: {str(e)}")
+
+    def save_to_csv(self, data, filename):
+        """Save data to CSV file with error handling"""
+        if not data:
+            self.logger.warning(f"No data to save to {filename}")
+            return
+        
+        try:
+            writer = CSVRowWriter(os.path.join(self.data_dir, filename))
+            for row in data:
+                writer.append(row)
+            writer.close()
+            self.logger.info(f"Data saved to {writer.path}")
+        except Exception as e:
+            self.logger.error(f"Failed to save data to {filename}: {str(e)}")
+
+    def save_to_json(self, data, filename):
+        """Save data to JSON file with error handling"""
+        if not data:
+            self.logger.warning(f"No data to save to {filename}")
+            return
+        
+        try:
+            filepath = self.serializer.dump(data, os.path.join(self.data_dir, filename))
+            self.logger.info(f"Data saved to {filepath}")
+        except Exception as e:
+            self.logger.error(f"Failed to save data to {filename}: {str(e)}")
+
+    def create_zip_archive(self):
+        """Create ZIP archive of all collected data"""
+        try:
+            self.logger.info("Creating ZIP archive of data...")
+            zip_path = self.archive_path
+            
+            archiver = ZipArchiver(
+                self.data_dir, zip_path,
+                compression=self.archive_compression,
+                change_detection=self.archive_change_detection
+            )
+            stats = archiver.build()
+            
+            self.logger.info(
+                f"ZIP archive created: {zip_path} ({stats['added']} added, {stats['updated']} updated, "
+                f"{stats['unchanged']} unchanged, {stats['removed']} removed)"
+            )
+            return zip_path
+        except Exception as e:
+            self.logger.error(f"Failed to create ZIP archive: {str(e)}")
+            return None
+
+    def create_summary_report(self, scraped_data=None):
+        """Create scraping summary report (counts come from the dataset writers)"""
+        try:
+            scraped_data = scraped_data or {}
+            breakdown = {}
+            
+            if self.datasets:
+                if scraped_data.get('profile_info'):
+                    breakdown['profile_info'] = 1
+                for name, dataset in self.datasets.items():
+                    breakdown[name] = dataset.count
+            else:
+                for key, data in scraped_data.items():
+                    if isinstance(data, list):
+                        breakdown[key] = len(data)
+                    elif isinstance(data, dict):
+                        breakdown[key] = 1
+            
+            # Rows written by stages completed in an earlier run
+            for name, count in self.resumed_counts.items():
+                breakdown.setdefault(name, count)
+            if self.resume and self.checkpoint.entry('profile_info').get('status') == 'done':
+                breakdown.setdefault('profile_info', 1)
+            
+            summary = {
+                "scraping_summary": {
+                    "profile_url": self.profile_url,
+                    "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "total_data_points": sum(count for key, count in breakdown.items() if key in DATA_POINT_DATASETS)
+                },
+                "data_breakdown": breakdown
+            }
+            
+            if self.stage_stats:
+                # Bytes of the files each stage left in data_dir (incl. background writes)
+                for name, stats in self.stage_stats.items():
+                    outputs = self.checkpoint.entry(name).get("outputs", {})
+                    stats["bytes_written"] = sum(
+                        os.path.getsize(os.path.join(self.data_dir, rel)) for rel in outputs
+                        if os.path.exists(os.path.join(self.data_dir, rel))
+                    )
+                summary["stages"] = self.stage_stats
+            if self.navigations:
+                summary["navigations"] = self.navigations
+            summary["startup"] = self.startup_stats
+            summary["serialization"] = dict(
+                self.serializer.stats,
+                backend=self.serializer.backend,
+                compression=self.serializer.compression
+            )
+            if self.downloader.results:
+                summary["downloads"] = self.downloader.stats
+                if self.downloader.cache:
+                    summary["downloads"]["cache"] = self.downloader.cache.stats
+            if self.pipeline and self.pipeline.tasks:
+                summary["pipeline"] = self.pipeline.stats
+            if self.activity_index is not None:
+                summary["activity_index"] = {
+                    "posts": len(self.activity_index.posts),
+                    "repeated_links": self.activity_index.hits
+                }
+            if self.image_processor and self.image_processor.results:
+                summary["image_processing"] = self.image_processor.stats
+            if self.snapshots:
+                summary["snapshots"] = dict(
+                    self.snapshots.stats,
+                    mode="replay" if self.replay else "record",
+                    snapshot_dir=self.snapshots.snapshot_dir
+                )
+            
+            self.save_to_json(summary, "scraping_summary.json")
+            self.logger.info("Summary report created")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to create summary report: {str(e)}")
+
+    def scrape_all(self):
+        """Run all scraping functions"""
+        scraped_data = {}
+        self.open_logging()
+        
+        try:
+            self.logger.info("Starting LinkedIn scraping process...")
+            
+            # When resuming, the browser starts with the first stage that still has to run
+            if not self.resume:
+                self.ensure_session()
+            
+            # 1. Save profile as PDF/HTML
+            self.run_stage("profile_pdf", self.save_profile_as_pdf)
+            
+            # 2. Scrape basic profile info
+            scraped_data['profile_info'] = self.run_stage("profile_info", self.scrape_basic_profile_info)
+            
+            # 3. Download profile image
+            self.run_stage("profile_image", self.download_profile_image)
+            
+            # 4. Scrape activities
+            scraped_data['posts'] = self.run_stage("posts", self.scrape_activity, "posts")
+            scraped_data['comments'] = self.run_stage("comments", self.scrape_activity, "comments")
+            scraped_data['reactions'] = self.run_stage("reactions", self.scrape_activity, "reactions")
+            
+            # 5. Scrape connections (only if logged in)
+            connection_stages = ("connections", "followers", "following")
+            if all(self.stage_done(name) for name in connection_stages) or self.ensure_session():
+                scraped_data['connections'] = self.run_stage("connections", self.scrape_connections, "connections")
+                scraped_data['followers'] = self.run_stage("followers", self.scrape_connections, "followers")
+                scraped_data['following'] = self.run_stage("following", self.scrape_connections, "following")
+            else:
+                self.logger.warning("Skipping connections scraping (not logged in)")
+            
+            # 6. Scrape interests
+            scraped_data['interests'] = self.run_stage("interests", self.scrape_interests)
+            
+            # 7. Download media
+            scraped_data['media_downloaded'] = self.run_stage("media", self.download_media)
+            
+            # Background writers, downloads and PDF rendering finish before the results are summarized
+            if self.pipeline:
+                self.join_pipeline()
+            
+            # 8. Collect image post-processing results
+            if self.image_processor:
+                self.run_stage("image_processing", self.finish_image_processing)
+            
+            # 9. Create summary report
+            self.report_suppressed_warnings()
+            self.create_summary_report(scraped_data)
+            
+            # 10. Create ZIP archive
+            zip_path = self.create_zip_archive()
+            
+            self.logger.info(f"\n{'='*50}")
+            self.logger.info("SCRAPING COMPLETED!")
+            self.logger.info(f"All data saved to: {self.data_dir}")
+            if zip_path:
+                self.logger.info(f"ZIP archive created: {zip_path}")
+            self.logger.info(f"{'='*50}")
+            
+        except KeyboardInterrupt:
+            self.logger.info("Scraping stopped by user")
+        except Exception as e:
+            self.logger.error(f"Fatal error during scraping: {str(e)}")
+        finally:
+            if self.pipeline:
+                self.pipeline.join(cancel=True)
+            
+            try:
+                self.selectors.save()
+            except Exception as e:
+                self.logger.warning(f"Failed to save selector statistics: {str(e)}")
+            
+            if self.store:
+                self.store.close()
+            self.downloader.close()
+            if self.resource_sampler:
+                self.resource_sampler.stop()
+            
+            if self.driver:
+                try:
+                    self.driver.quit()
+                    self.logger.info("WebDriver closed")
+                except Exception as e:
+                    self.logger.error(f"Failed to close WebDriver: {str(e)}")
+            
+            self.close_logging()
+
+def parse_options(argv=None):
+    """
+    Command line options for the run modes; the profile URL, login and
+    headless mode are asked for interactively. Only options that are given
+    are returned, everything else keeps the LinkedInScraperPro default.
+    """
+    parser = argparse.ArgumentParser(description="LinkedIn Profile Scraper Pro", argument_default=argparse.SUPPRESS)
+    parser.add_argument("--resume", action="store_true", help="skip stages completed by an earlier run")
+    parser.add_argument("--refresh", action="store_true", help="only collect activities newer than the stored ones")
+    parser.add_argument("--dedupe-activities", action="store_true", help="store each post once in activity_posts")
+    replay_group = parser.add_mutually_exclusive_group()
+    replay_group.add_argument("--record", action="store_true", help="save page snapshots to --snapshot-dir")
+    replay_group.add_argument("--replay", action="store_true", help="extract from recorded snapshots, no browser")
+    parser.add_argument("--snapshot-dir", help="location of the recorded snapshots")
+    parser.add_argument("--storage", choices=["files", "sqlite"])
+    parser.add_argument("--json-format", choices=["json", "ndjson"])
+    parser.add_argument("--json-compression", choices=["gzip", "zstd"])
+    parser.add_argument("--archive-compression", choices=["deflate", "zstd", "store"])
+    parser.add_argument("--no-pipeline", dest="pipeline", action="store_false", help="run all work on the browser thread")
+    parser.add_argument("--image-processing", action="store_true", help="verify, thumbnail and dedupe downloaded images")
+    parser.add_argument("--webp-quality", type=int, help="also save WebP copies at this quality")
+    parser.add_argument("--driver-path", help="chromedriver binary to use")
+    parser.add_argument("--log-format", choices=["text", "json"])
+    return vars(parser.parse_args(argv))
+
+
+def main():
+    options = parse_options()
+    
+    print("=" * 60)
+    print("     LINKEDIN PROFILE SCRAPER PRO - COMPLETE SOLUTION")
+    print("=" * 60)
+    print("IMPORTANT WARNING:")
+    print("- LinkedIn scraping may violate their Terms of Service")
+    print("- Use only for educational and ethical purposes")
+    print("- Respect privacy and rights of others")
+    print("- Use responsibly and legally")
+    print("=" * 60)
+    
+    try:
+        # Input profile URL
+        while True:
+            profile_url = input("\nEnter LinkedIn profile URL: ").strip()
+            if profile_url:
+                break
+            print("URL cannot be empty!")
+        
+        # Ask for login
+        use_login = input("Do you want to login to LinkedIn? (y/n): ").lower().strip() == 'y'
+        
+        email = None
+        password = None
+        
+        if use_login:
+            email = input("Enter LinkedIn email: ").strip()
+            password = input("Enter LinkedIn password: ").strip()
+            
+            if not email or not password:
+                print("Email and password required for login!")
+                use_login = False
+        
+        # Ask for headless mode
+        headless = input("Run in headless mode (no browser window)? (y/n): ").lower().strip() == 'y'
+        
+        # Confirm before starting
+        print(f"\nConfiguration:")
+        print(f"- Profile URL: {profile_url}")
+        print(f"- Login: {'Yes' if use_login else 'No'}")
+        print(f"- Headless Mode: {'Yes' if headless else 'No'}")
+        for name, value in options.items():
+            print(f"- {name}: {value}")
+        
+        confirm = input("\nProceed with scraping? (y/n): ").lower().strip()
+        if confirm != 'y':
+            print("Scraping cancelled.")
+            return
+        
+        # Start scraping
+        scraper = LinkedInScraperPro(profile_url, email, password, headless, **options)
+        scraper.scrape_all()
+        
+    except KeyboardInterrupt:
+        print("\nProgram stopped by user.")
+    except Exception as e:
+        print(f"\nError occurred: {str(e)}")
+        print("Please try again or check your configuration.")
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,251 @@
+"""
+Local fixture site for offline benchmarks
+
+Serves pages shaped like the LinkedIn pages LinkedInScraperPro targets:
+the profile top card, the activity feed (scaffold-finite-scroll__content with
+infinite scroll and Posts/Comments/Reactions tabs), entity-result lists for
+connections, followers, following and interests, and the media grid. Images
+are generated JPEGs.
+
+The list size comes from the profile path: /in/bench-1000/... serves 1000
+items per list. Saved pages in a fixtures directory take precedence over the
+synthetic ones (<fixtures>/<url path>/index.html).
+"""
+
+import io
+import os
+import random
+import re
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from PIL import Image, ImageDraw
+
+
+# Items appended per infinite-scroll load, and the simulated load latency
+PAGE_SIZE = 50
+LOAD_DELAY_MS = 50
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<main>
+{body}
+</main>
+<script>
+{script}
+</script>
+</body>
+</html>
+"""
+
+PROFILE_BODY = """
+<section class="pv-top-card">
+  <img class="pv-top-card-profile-picture" src="/img/profile.jpg" alt="profile photo">
+  <h1 class="text-heading-xlarge">Bench Profile {size}</h1>
+  <div class="text-body-medium">Synthetic headline for benchmarks</div>
+  <span class="text-body-small inline">Jakarta, Indonesia</span>
+  <div class="display-flex full-width">{about}</div>
+</section>
+"""
+
+# Renders `total` items into the list container in PAGE_SIZE batches as the
+# window is scrolled to the bottom. renderItem(i) returns the item HTML.
+INFINITE_SCROLL_SCRIPT = """
+var total = {total}, pageSize = {page_size}, delay = {delay};
+var list = document.getElementById("list");
+var rendered = 0, loading = false;
+{render}
+function loadMore() {{
+    var end = Math.min(rendered + pageSize, total);
+    var html = "";
+    for (var i = rendered; i < end; i++) {{ html += renderItem(i); }}
+    list.insertAdjacentHTML("beforeend", html);
+    rendered = end;
+    loading = false;
+}}
+function onScroll() {{
+    if (loading || rendered >= total) {{ return; }}
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) {{
+        loading = true;
+        setTimeout(loadMore, delay);
+    }}
+}}
+window.addEventListener("scroll", onScroll);
+loadMore();
+"""
+
+ACTIVITY_RENDER = """
+var activityType = "posts";
+function renderItem(i) {
+    var html = '<div class="feed-shared-update-v2">' +
+        '<a href="/feed/update/urn:li:activity-' + activityType + '-' + i + '/posts/' + i + '">post</a>' +
+        '<div class="update-components-text">' + activityType + ' body ' + i +
+        ' lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor</div>';
+    if (activityType === "comments") {
+        html += '<div class="comment-text">comment ' + i + '</div>';
+    }
+    return html + '</div>';
+}
+function selectTab(type) {
+    activityType = type;
+    list.innerHTML = "";
+    rendered = 0;
+    loadMore();
+}
+"""
+
+ACTIVITY_BODY = """
+<div class="tabs">
+  <button aria-label="Posts" onclick="selectTab('posts')">Posts</button>
+  <button aria-label="Comments" onclick="selectTab('comments')">Comments</button>
+  <button aria-label="Reactions" onclick="selectTab('reactions')">Reactions</button>
+</div>
+<div class="profile-detail-activity">
+  <div id="list" class="scaffold-finite-scroll__content"></div>
+</div>
+"""
+
+ENTITY_RENDER = """
+function renderItem(i) {{
+    return '<div class="entity-result">' +
+        '<span class="entity-result__title-text"><a href="/in/{kind}-' + i + '/?miniProfileUrn=x">{label} ' + i + '</a></span>' +
+        '<div class="entity-result__primary-subtitle">Subtitle of {label} ' + i + '</div>' +
+        '</div>';
+}}
+"""
+
+ENTITY_BODY = """
+<div id="list" class="scaffold-finite-scroll__content"></div>
+"""
+
+
+def render_page(title, body, script=""):
+    return PAGE_TEMPLATE.format(title=title, body=body, script=script)
+
+
+def infinite_list(total, render):
+    return INFINITE_SCROLL_SCRIPT.format(total=total, page_size=PAGE_SIZE, delay=LOAD_DELAY_MS, render=render)
+
+
+def profile_page(size):
+    about = " ".join(["About text."] * 40)
+    return render_page("Profile", PROFILE_BODY.format(size=size, about=about))
+
+
+def activity_page(size):
+    return render_page("Activity", ACTIVITY_BODY, infinite_list(size, ACTIVITY_RENDER))
+
+
+def entity_page(size, kind, label):
+    return render_page(label, ENTITY_BODY, infinite_list(size, ENTITY_RENDER.format(kind=kind, label=label)))
+
+
+def media_page(count):
+    images = "\n".join(
+        f'<li><img class="ivm-view-attr__img--centered" src="/img/media-{i}.jpg" alt="media {i}"></li>'
+        for i in range(count)
+    )
+    return render_page("Media", f'<div class="scaffold-finite-scroll__content"><ul>{images}</ul></div>')
+
+
+_image_cache = {}
+_image_lock = threading.Lock()
+
+
+def fixture_image(name, size=(800, 800)):
+    """
+    Deterministic JPEG per name
+
+    Random blocks seeded by the name give every image its own structure.
+    Solid colors would not do: flat images all share the same difference
+    hash, so image post-processing could not tell them apart perceptually.
+    """
+    with _image_lock:
+        if name not in _image_cache:
+            rng = random.Random(name)
+            img = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+            draw = ImageDraw.Draw(img)
+            for _ in range(12):
+                x, y = rng.randrange(size[0]), rng.randrange(size[1])
+                w, h = rng.randrange(size[0] // 8, size[0] // 2), rng.randrange(size[1] // 8, size[1] // 2)
+                draw.rectangle([x, y, x + w, y + h], fill=tuple(rng.randrange(256) for _ in range(3)))
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=85)
+            _image_cache[name] = buffer.getvalue()
+        return _image_cache[name]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Routes /in/bench-<size>/... to the synthetic pages"""
+
+    fixtures_dir = None
+    media_count = 50
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type="text/html; charset=utf-8", status=200):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _saved_page(self, path):
+        if not self.fixtures_dir:
+            return None
+        saved = os.path.join(self.fixtures_dir, path.strip("/"), "index.html")
+        if os.path.isfile(saved):
+            with open(saved, "rb") as f:
+                return f.read()
+        return None
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+
+        if path.startswith("/img/"):
+            self._send(fixture_image(path[5:]), "image/jpeg")
+            return
+
+        saved = self._saved_page(path)
+        if saved is not None:
+            self._send(saved)
+            return
+
+        match = re.match(r"^/in/bench-(\d+)(/.*)?$", path)
+        if not match:
+            self._send("Not found", "text/plain", 404)
+            return
+
+        size = int(match.group(1))
+        page = (match.group(2) or "/").rstrip("/")
+
+        if page == "":
+            self._send(profile_page(size))
+        elif page == "/details/activity":
+            self._send(activity_page(size))
+        elif page in ("/details/connections", "/details/followers", "/details/following"):
+            kind = page.rsplit("/", 1)[1]
+            self._send(entity_page(size, kind, kind.capitalize()))
+        elif page == "/details/interests":
+            detail = parse_qs(parsed.query).get("detail", ["companies"])[0]
+            self._send(entity_page(size, detail, detail.capitalize()))
+        elif page == "/details/media":
+            self._send(media_page(self.media_count))
+        else:
+            self._send("Not found", "text/plain", 404)
+
+
+def start_server(port=0, fixtures_dir=None, media_count=50):
+    """Start the fixture site in a background thread, returns (server, base_url)"""
+    handler = type("Handler", (FixtureHandler,), {"fixtures_dir": fixtures_dir, "media_count": media_count})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, name="fixture-site", daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
@@ -0,0 +1,363 @@
+"""
+Offline benchmarks for LinkedInScraperPro
+
+Runs the scraping stages against the local fixture site in headless Chrome
+and the dataset writers without a browser, for several list sizes:
+
+    python benchmarks/run_benchmarks.py                      # 100 and 1000 items
+    python benchmarks/run_benchmarks.py --sizes 100 1000 10000
+    python benchmarks/run_benchmarks.py --only writers       # no browser needed
+    python benchmarks/run_benchmarks.py --save-baseline      # store results as baseline
+
+Every benchmark reports throughput (items/s), latency percentiles, and peak
+memory. For browser benchmarks, latency is the time from stage start until
+each item reached the dataset writer. For writer benchmarks, it is the time
+each append took. The results are compared against
+benchmarks/baseline.json. The committed baseline holds the writer benchmarks
+only (measured without Chrome, see its "environment"); browser benchmarks are
+reported as having no baseline until one is saved on a machine with Chrome.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+SCRIPT_PATH = os.path.join(REPO_DIR, "Linkedin-Creeps-Scrapper-V7-Deployement.py")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# Pinned chromedriver path shared by all runs (each run works in a temp directory)
+DRIVER_PIN_PATH = os.path.join(BENCH_DIR, "chromedriver.json")
+
+BROWSER_BENCHMARKS = ["activity", "connections", "interests", "media"]
+WRITER_BENCHMARKS = ["writer_json", "writer_ndjson", "writer_sqlite"]
+
+
+def load_scraper_module():
+    """Import the scraper script (its file name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location("linkedin_scraper", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak RSS of this process so far (Unix), None elsewhere"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1048576 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+class ItemClock:
+    """Records when rows reach the dataset writers, relative to the stage start"""
+
+    def __init__(self):
+        self.started = None
+        self.latencies = []
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.latencies = []
+
+    def wrap(self, dataset):
+        append = dataset.append
+
+        def timed_append(row):
+            self.latencies.append(time.perf_counter() - self.started)
+            append(row)
+
+        dataset.append = timed_append
+        return dataset
+
+
+def summarize(name, size, runs):
+    """Aggregate repeated runs of one benchmark"""
+    seconds = [run["seconds"] for run in runs]
+    latencies = [latency for run in runs for latency in run["latencies"]]
+    items = runs[-1]["items"]
+    median = statistics.median(seconds)
+    result = {
+        "benchmark": name,
+        "size": size,
+        "items": items,
+        "runs": len(runs),
+        "seconds_median": round(median, 3),
+        "throughput": round(items / median, 1) if median else None,
+        "latency_p50": round(percentile(latencies, 50), 4) if latencies else None,
+        "latency_p95": round(percentile(latencies, 95), 4) if latencies else None,
+        "latency_p99": round(percentile(latencies, 99), 4) if latencies else None,
+        "peak_memory_mb": max((run["peak_memory_mb"] or 0) for run in runs) or None
+    }
+    if any(run.get("browser_peak_mb") for run in runs):
+        result["browser_peak_mb"] = max(run.get("browser_peak_mb") or 0 for run in runs)
+    return result
+
+
+def run_browser_benchmark(module, name, size, base_url, options):
+    """Run one scraping stage of a fresh scraper against the fixture site"""
+    work_dir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    try:
+        with working_dir(work_dir):
+            # The data directory (and log) are created relative to the working directory
+            os.makedirs("linkedin_data", exist_ok=True)
+            scraper = module.LinkedInScraperPro(
+                "https://www.linkedin.com/in/bench",
+                headless=True,
+                max_scrolls=size // 50 + 5,
+                incremental_extraction=options.incremental,
+                scroll_mode=options.scroll_mode,
+                block_resources=False,
+                cache_dir=None,
+                pipeline=options.pipeline,
+                sample_interval=0.2,
+                driver_path=options.driver_path
+            )
+            scraper.driver_pin_path = DRIVER_PIN_PATH
+            scraper.profile_url = f"{base_url}/in/bench-{size}"
+            scraper.wait_time = 0.2
+
+            clock = ItemClock()
+            open_dataset = scraper.open_dataset
+            scraper.open_dataset = lambda dataset_name: clock.wrap(open_dataset(dataset_name))
+
+            stages = {
+                "activity": [("posts", scraper.scrape_activity, ("posts",)),
+                             ("comments", scraper.scrape_activity, ("comments",))],
+                "connections": [("connections", scraper.scrape_connections, ("connections",))],
+                "interests": [("interests", scraper.scrape_interests, ())],
+                "media": [("media", scraper.download_media, ())]
+            }[name]
+
+            scraper.start_driver()
+            try:
+                clock.start()
+                started = time.perf_counter()
+                items = 0
+                for stage_name, func, args in stages:
+                    result = scraper.run_stage(stage_name, func, *args)
+                    if scraper.pipeline:
+                        scraper.join_pipeline()
+                    if isinstance(result, dict):
+                        items += sum(len(rows) for rows in result.values())
+                    elif isinstance(result, list):
+                        items += len(result)
+                    elif isinstance(result, int) and not isinstance(result, bool):
+                        items += result
+                seconds = time.perf_counter() - started
+
+                resources = [stats.get("resources") or {} for stats in scraper.stage_stats.values()]
+                return {
+                    "seconds": seconds,
+                    "items": items,
+                    "latencies": clock.latencies,
+                    "peak_memory_mb": max((r.get("python_rss_peak_mb", 0) for r in resources), default=0)
+                                      or peak_rss_mb(),
+                    "browser_peak_mb": max((r.get("browser_rss_peak_mb", 0) for r in resources), default=0)
+                }
+            finally:
+                scraper.driver.quit()
+                scraper.downloader.close()
+                if scraper.resource_sampler:
+                    scraper.resource_sampler.stop()
+                scraper.close_logging()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_writer_benchmark(module, name, size, options):
+    """Stream `size` activity rows through one storage backend"""
+    work_dir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    logger = module.logging.getLogger("benchmarks")
+    try:
+        serializer = module.JSONSerializer()
+        rows = [{
+            "no": i,
+            "link": f"https://www.linkedin.com/feed/update/urn:li:activity-{i}/",
+            "text": f"post body {i} " + "lorem ipsum dolor sit amet " * 12,
+            "comment": "",
+            "type": "posts",
+            "scraped_at": "2024-01-01 00:00:00"
+        } for i in range(size)]
+
+        store = None
+        if name == "writer_sqlite":
+            store = module.SQLiteResultStore(os.path.join(work_dir, "bench.db"))
+            writers = [module.SQLiteRowWriter(store, "https://www.linkedin.com/in/bench", "posts")]
+        elif name == "writer_ndjson":
+            writers = [module.CSVRowWriter(os.path.join(work_dir, "posts.csv")),
+                       module.NDJSONRowWriter(os.path.join(work_dir, "posts.ndjson"), serializer)]
+        else:
+            writers = [module.CSVRowWriter(os.path.join(work_dir, "posts.csv")),
+                       module.JSONArrayRowWriter(os.path.join(work_dir, "posts.json"), serializer)]
+        dataset = module.DatasetWriter("posts", writers, logger)
+
+        tracemalloc.start()
+        latencies = []
+        started = time.perf_counter()
+        for row in rows:
+            appended = time.perf_counter()
+            dataset.append(row)
+            latencies.append(time.perf_counter() - appended)
+        dataset.close()
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if store:
+            store.close()
+        return {
+            "seconds": seconds,
+            "items": size,
+            "latencies": latencies,
+            "peak_memory_mb": round(peak / 1048576, 2)
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare(results, baseline, threshold):
+    """Print changes against the baseline, returns the regressed benchmarks"""
+    previous = {(r["benchmark"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    environment = baseline.get("environment", {})
+    print(f"\nComparison with baseline ({baseline.get('created_at')}, python {environment.get('python')}, "
+          f"{environment.get('platform')}, {environment.get('cpu_count')} CPUs):")
+    for result in results:
+        base = previous.get((result["benchmark"], result["size"]))
+        if not base or not base.get("throughput") or not result.get("throughput"):
+            print(f"  {result['benchmark']:<14} {result['size']:>6}  no baseline")
+            continue
+        change = (result["throughput"] - base["throughput"]) / base["throughput"] * 100
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(result)
+        print(f"  {result['benchmark']:<14} {result['size']:>6}  "
+              f"{base['throughput']:>10.1f} -> {result['throughput']:>10.1f} items/s ({change:+.1f}%){flag}")
+    return regressions
+
+
+def print_results(results):
+    print(f"\n{'benchmark':<14} {'size':>6} {'items':>7} {'seconds':>8} {'items/s':>10} "
+          f"{'p50':>8} {'p95':>8} {'peak MB':>8}")
+    for r in results:
+        print(f"{r['benchmark']:<14} {r['size']:>6} {r['items']:>7} {r['seconds_median']:>8.2f} "
+              f"{(r['throughput'] or 0):>10.1f} {(r['latency_p50'] or 0):>8.3f} {(r['latency_p95'] or 0):>8.3f} "
+              f"{(r['peak_memory_mb'] or 0):>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline LinkedInScraperPro benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--only", nargs="+", choices=BROWSER_BENCHMARKS + WRITER_BENCHMARKS + ["browser", "writers"])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark and size")
+    parser.add_argument("--media", type=int, default=50, help="images in the media grid")
+    parser.add_argument("--fixtures", help="directory with saved pages that override the synthetic ones")
+    parser.add_argument("--scroll-mode", default="observer", choices=["observer", "sleep"])
+    parser.add_argument("--incremental", action="store_true", help="use incremental extraction")
+    parser.add_argument("--driver-path", default=os.environ.get("CHROMEDRIVER_PATH"),
+                        help="chromedriver binary (default CHROMEDRIVER_PATH, else the path pinned in "
+                             "benchmarks/chromedriver.json by the first run)")
+    parser.add_argument("--no-pipeline", dest="pipeline", action="store_false")
+    parser.add_argument("--output", default=os.path.join(BENCH_DIR, "results.json"))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed throughput drop in percent")
+    options = parser.parse_args()
+
+    selected = options.only or BROWSER_BENCHMARKS + WRITER_BENCHMARKS
+    if "browser" in selected:
+        selected = [name for name in selected if name != "browser"] + BROWSER_BENCHMARKS
+    if "writers" in selected:
+        selected = [name for name in selected if name != "writers"] + WRITER_BENCHMARKS
+
+    module = load_scraper_module()
+    server = None
+    base_url = None
+    if any(name in BROWSER_BENCHMARKS for name in selected):
+        # The fixture site needs Pillow, writer-only runs do not
+        sys.path.insert(0, BENCH_DIR)
+        from fixture_site import start_server
+
+        server, base_url = start_server(fixtures_dir=options.fixtures, media_count=options.media)
+        print(f"Fixture site running at {base_url}")
+
+    results = []
+    try:
+        for name in selected:
+            for size in options.sizes:
+                runs = []
+                for _ in range(options.repeat):
+                    if name in WRITER_BENCHMARKS:
+                        runs.append(run_writer_benchmark(module, name, size, options))
+                    else:
+                        runs.append(run_browser_benchmark(module, name, size, base_url, options))
+                result = summarize(name, size, runs)
+                results.append(result)
+                print(f"{name} [{size}]: {result['throughput']} items/s, p95 {result['latency_p95']}s")
+    finally:
+        if server:
+            server.shutdown()
+
+    print_results(results)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {"python": sys.version.split()[0], "platform": platform.platform(),
+                        "machine": platform.machine(), "cpu_count": os.cpu_count()},
+        "options": {"scroll_mode": options.scroll_mode, "incremental": options.incremental,
+                    "pipeline": options.pipeline, "repeat": options.repeat},
+        "results": results
+    }
+    with open(options.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {options.output}")
+
+    regressions = []
+    if options.save_baseline:
+        shutil.copyfile(options.output, options.baseline)
+        print(f"Baseline saved to {options.baseline}")
+    elif os.path.exists(options.baseline):
+        with open(options.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), options.threshold)
+    else:
+        print(f"\nNo baseline at {options.baseline}, nothing compared (create one with --save-baseline)")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())